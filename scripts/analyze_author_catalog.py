@@ -140,6 +140,8 @@ def analyze_author_catalog(author_name):
             rf'\b(?:{non_english_languages})\s+(?:edition|version|translation)\b',
             re.IGNORECASE
         )
+        # Literal prefilter: a standalone match always contains one of these words
+        edition_word_pattern = re.compile(r'edition|version|translation', re.IGNORECASE)
         spanish_indicators = re.compile(
             r'\b(?:edici[oó]n|colecci[oó]n|estuche|libro|libros|misterio|pr[ií]ncipe|gryffindor|hufflepuff|slytherin|ravenclaw)\b',
             re.IGNORECASE
@@ -150,7 +152,7 @@ def analyze_author_catalog(author_name):
             if book.title:
                 if (paren_pattern.search(book.title) or 
                     bracket_pattern.search(book.title) or
-                    standalone_pattern.search(book.title) or
+                    (edition_word_pattern.search(book.title) and standalone_pattern.search(book.title)) or
                     spanish_indicators.search(book.title)):
                     non_english_books.append(book)
         
@@ -51,7 +51,7 @@ def check_specific_author(author_name: str, min_books: int = 1, dry_run: bool =
     # This matches the filtering logic in web/app.py
     # A recommendation is visible if NONE of these flags are True
     all_recs = session.query(Recommendation).filter(
-        func.lower(Recommendation.author) == author_name.lower()
+        Recommendation.author_lc == author_name.lower()
     ).all()
     
     # Filter to only visible ones (where all flags are False or None)
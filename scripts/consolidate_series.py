@@ -11,15 +11,17 @@ import sys
 import re
 from pathlib import Path
 from collections import defaultdict
+from functools import lru_cache
 from typing import List, Dict, Tuple, Set, Optional
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.models import init_db, get_session, AuthorCatalogBook, Author
+from src.models import init_db, get_session, find_author_by_name, AuthorCatalogBook, Author
 from sqlalchemy import func
 
 
+@lru_cache(maxsize=32768)
 def normalize_series_name(series_name: str) -> str:
     """
     Normalize a series name for comparison.
@@ -64,14 +66,24 @@ def find_series_consolidations(author: Author, session) -> List[Dict]:
     - confidence: How confident we are this is the same series
     """
     # Get all catalog books for this author that are in series
-    catalog_books = session.query(AuthorCatalogBook).filter_by(
-        author_id=author.id
-    ).filter(AuthorCatalogBook.series_name.isnot(None)).all()
+    # (only the columns the preview and update need, as lightweight rows)
+    catalog_books = session.query(
+        AuthorCatalogBook.id,
+        AuthorCatalogBook.title,
+        AuthorCatalogBook.series_name,
+        AuthorCatalogBook.series_position
+    ).filter(
+        AuthorCatalogBook.author_id == author.id,
+        AuthorCatalogBook.series_name.isnot(None)
+    ).order_by(
+        AuthorCatalogBook.series_position.nullslast(),
+        AuthorCatalogBook.id
+    ).all()
     
     if not catalog_books:
         return []
     
-    # Group by normalized series name
+    # Group by normalized series name (books stay in series position order)
     normalized_groups = defaultdict(list)
     for book in catalog_books:
         normalized = normalize_series_name(book.series_name)
@@ -113,6 +125,7 @@ def find_series_consolidations(author: Author, session) -> List[Dict]:
                 'normalized_name': normalized,
                 'books': books,
                 'total_books': len(books),
+                'update_count': sum(1 for book in books if book.series_name != canonical_name),
                 'confidence': confidence,
                 'positions': sorted(unique_positions) if positions else []
             })
@@ -124,31 +137,36 @@ def preview_consolidations(consolidations: List[Dict], author: Author):
     """
     Show preview of series consolidations.
     """
-    print("="*80)
-    print(f"AUTHOR: {author.name} (ID: {author.id})")
-    print(f"Series consolidations found: {len(consolidations)}")
-    print("="*80)
-    print()
+    # Build the whole preview and write it once; per-line print() is slow for large lists
+    lines = [
+        "="*80,
+        f"AUTHOR: {author.name} (ID: {author.id})",
+        f"Series consolidations found: {len(consolidations)}",
+        "="*80,
+        ""
+    ]
     
     for i, consolidation in enumerate(consolidations, 1):
-        print(f"{i}. CONSOLIDATION GROUP")
-        print(f"   Normalized name: \"{consolidation['normalized_name']}\"")
-        print(f"   Canonical name (will use): \"{consolidation['canonical_name']}\"")
-        print(f"   Variant names to merge:")
+        lines.append(f"{i}. CONSOLIDATION GROUP")
+        lines.append(f"   Normalized name: \"{consolidation['normalized_name']}\"")
+        lines.append(f"   Canonical name (will use): \"{consolidation['canonical_name']}\"")
+        lines.append(f"   Variant names to merge:")
         for variant in consolidation['variant_names']:
             if variant != consolidation['canonical_name']:
-                print(f"      - \"{variant}\" → \"{consolidation['canonical_name']}\"")
-        print(f"   Confidence: {consolidation['confidence']}")
-        print(f"   Total books: {consolidation['total_books']}")
+                lines.append(f"      - \"{variant}\" → \"{consolidation['canonical_name']}\"")
+        lines.append(f"   Confidence: {consolidation['confidence']}")
+        lines.append(f"   Total books: {consolidation['total_books']}")
         if consolidation['positions']:
-            print(f"   Series positions: {consolidation['positions']}")
+            lines.append(f"   Series positions: {consolidation['positions']}")
         
         # Show books
-        print(f"   Books:")
-        for book in sorted(consolidation['books'], key=lambda x: x.series_position or 999):
+        lines.append(f"   Books:")
+        for book in consolidation['books']:
             variant_marker = " ⚠" if book.series_name != consolidation['canonical_name'] else ""
-            print(f"      #{book.series_position or '?'}: {book.title} (series: \"{book.series_name}\"){variant_marker}")
-        print()
+            lines.append(f"      #{book.series_position or '?'}: {book.title} (series: \"{book.series_name}\"){variant_marker}")
+        lines.append("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def execute_consolidation(consolidation: Dict, session, dry_run: bool = True) -> int:
@@ -158,21 +176,15 @@ def execute_consolidation(consolidation: Dict, session, dry_run: bool = True) ->
     Returns number of books updated.
     """
     canonical_name = consolidation['canonical_name']
-    variant_names = consolidation['variant_names']
-    books = consolidation['books']
-    
-    updated_count = 0
-    
-    for book in books:
-        if book.series_name != canonical_name:
-            if not dry_run:
-                book.series_name = canonical_name
-            updated_count += 1
+    variant_ids = [book.id for book in consolidation['books'] if book.series_name != canonical_name]
     
-    if not dry_run:
+    if not dry_run and variant_ids:
+        session.query(AuthorCatalogBook).filter(
+            AuthorCatalogBook.id.in_(variant_ids)
+        ).update({AuthorCatalogBook.series_name: canonical_name}, synchronize_session=False)
         session.commit()
     
-    return updated_count
+    return len(variant_ids)
 
 
 def scan_all_authors(min_books: int = 1, limit: Optional[int] = None) -> List[Dict]:
@@ -197,7 +209,8 @@ def scan_all_authors(min_books: int = 1, limit: Optional[int] = None) -> List[Di
     ).having(
         func.count(AuthorCatalogBook.id) >= min_books
     ).order_by(
-        func.count(AuthorCatalogBook.id).desc()
+        func.count(AuthorCatalogBook.id).desc(),
+        Author.id  # stable numbering for authors with equal counts
     )
     
     if limit:
@@ -251,9 +264,7 @@ if __name__ == '__main__':
     
     if args.author:
         # Check specific author
-        author = session.query(Author).filter(
-            Author.name.ilike(f'%{args.author}%')
-        ).first()
+        author = find_author_by_name(session, args.author)
         
         if not author:
             print(f"Author '{args.author}' not found.")
@@ -297,9 +308,7 @@ if __name__ == '__main__':
             
             total_consolidations += len(consolidations)
             for consolidation in consolidations:
-                variant_count = sum(1 for b in consolidation['books'] 
-                                  if b.series_name != consolidation['canonical_name'])
-                total_books_to_update += variant_count
+                total_books_to_update += consolidation['update_count']
         
         print("="*80)
         print("SUMMARY")
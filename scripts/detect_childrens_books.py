@@ -18,7 +18,7 @@ from typing import List, Dict, Tuple, Optional
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.models import init_db, get_session, AuthorCatalogBook, Author, Recommendation
+from src.models import init_db, get_session, find_author_by_name, AuthorCatalogBook, Author, Recommendation
 from sqlalchemy import func
 
 
@@ -197,8 +197,6 @@ def scan_all_authors(min_books: int = 1, limit: Optional[int] = None) -> List[Di
     
     # Get authors with at least min_books eligible catalog books
     # (same filtering as recommendations: is_read=False, not non-English)
-    from src.deduplication.language_detection import is_english_title
-    
     prolific_query = session.query(
         Author.id,
         Author.name,
@@ -212,7 +210,8 @@ def scan_all_authors(min_books: int = 1, limit: Optional[int] = None) -> List[Di
     ).having(
         func.count(AuthorCatalogBook.id) >= min_books
     ).order_by(
-        func.count(AuthorCatalogBook.id).desc()
+        func.count(AuthorCatalogBook.id).desc(),
+        Author.id  # stable numbering for authors with equal counts
     )
     
     if limit:
@@ -257,9 +256,7 @@ if __name__ == '__main__':
     
     if args.author:
         # Check specific author
-        author = session.query(Author).filter(
-            Author.name.ilike(f'%{args.author}%')
-        ).first()
+        author = find_author_by_name(session, args.author)
         
         if not author:
             print(f"Author '{args.author}' not found.")
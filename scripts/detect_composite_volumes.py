@@ -110,8 +110,17 @@ def find_composite_standalone_matches(catalog_books: List[AuthorCatalogBook], se
     matches = []
     
     # Separate composite and standalone catalog books
-    composite_books = [b for b in catalog_books if is_composite_volume(b)]
-    standalone_books = [b for b in catalog_books if not is_composite_volume(b)]
+    composite_books = []
+    standalone_books = []
+    for b in catalog_books:
+        (composite_books if is_composite_volume(b) else standalone_books).append(b)
+    
+    # Normalize each standalone title once rather than once per component title
+    standalone_keys = [
+        (standalone, normalize_title_advanced(standalone.title),
+         extract_base_title(standalone.title).lower(), standalone.title.lower())
+        for standalone in standalone_books
+    ]
     
     for composite in composite_books:
         # Get series info directly from catalog book
@@ -141,15 +150,13 @@ def find_composite_standalone_matches(catalog_books: List[AuthorCatalogBook], se
         for component_title in component_titles:
             # Normalize for matching
             component_normalized = normalize_title_advanced(component_title)
-            component_base = extract_base_title(component_title)
+            component_base = extract_base_title(component_title).lower()
+            component_lower = component_title.lower()
             
             best_match = None
             best_score = 0
             
-            for standalone in standalone_books:
-                standalone_normalized = normalize_title_advanced(standalone.title)
-                standalone_base = extract_base_title(standalone.title)
-                
+            for standalone, standalone_normalized, standalone_base, standalone_lower in standalone_keys:
                 # Check exact normalized match
                 if component_normalized and standalone_normalized:
                     if component_normalized == standalone_normalized:
@@ -159,17 +166,17 @@ def find_composite_standalone_matches(catalog_books: List[AuthorCatalogBook], se
                 
                 # Check base title match
                 if component_base and standalone_base:
-                    if component_base.lower() == standalone_base.lower():
+                    if component_base == standalone_base:
                         if best_score < 0.8:
                             best_match = standalone
                             best_score = 0.8
                 
                 # Check if component title is contained in standalone (or vice versa)
-                if component_title.lower() in standalone.title.lower():
+                if component_lower in standalone_lower:
                     if best_score < 0.7:
                         best_match = standalone
                         best_score = 0.7
-                elif standalone.title.lower() in component_title.lower():
+                elif standalone_lower in component_lower:
                     if best_score < 0.7:
                         best_match = standalone
                         best_score = 0.7
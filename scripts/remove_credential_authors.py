@@ -2,36 +2,26 @@
 """Remove authors that are only credentials (e.g., 'PhD', 'MD')"""
 import sys
 from pathlib import Path
-import re
+import string
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.models import init_db, get_session, Author, AuthorCatalogBook, Book, Recommendation
-from sqlalchemy import func, or_
+from src.models import init_db, get_session, is_database_locked, Author, AuthorCatalogBook, Book, Recommendation
+from sqlalchemy import func
+import random
 import time
 
 
+# Credential-only names, compared after dropping dots/whitespace and lowercasing
+# (so "Ph.D.", "M. D.", "Dr." and "Rev" all reduce to one of these)
+_CREDENTIALS = frozenset({'phd', 'md', 'dr', 'prof', 'professor', 'rev', 'reverend'})
+_STRIP_DOTS_AND_SPACES = str.maketrans('', '', '.' + string.whitespace)
+
+
 def is_credential_only(name):
     """Check if a name is only a credential with no actual author name"""
-    name_lower = name.strip().lower()
-    
-    credential_patterns = [
-        r'^ph\.?\s*d\.?$',  # Just "PhD" or "Ph.D."
-        r'^m\.?\s*d\.?$',  # Just "MD" or "M.D." or "M D" or "M. D."
-        r'^md$',  # Just "MD" (explicit check)
-        r'^dr\.?$',  # Just "Dr" or "Dr."
-        r'^prof\.?$',  # Just "Prof" or "Prof."
-        r'^professor$',  # Just "Professor"
-        r'^rev\.?$',  # Just "Rev" or "Rev."
-        r'^reverend$',  # Just "Reverend"
-    ]
-    
-    for pattern in credential_patterns:
-        if re.match(pattern, name_lower):
-            return True
-    
-    return False
+    return name.translate(_STRIP_DOTS_AND_SPACES).lower() in _CREDENTIALS
 
 
 def remove_credential_authors(dry_run=True):
@@ -48,156 +38,153 @@ def remove_credential_authors(dry_run=True):
     else:
         print("LIVE MODE - Changes will be committed\n")
     
-    all_authors = session.query(Author).all()
-    credential_authors = []
-    
-    for author in all_authors:
-        if is_credential_only(author.name):
-            catalog_count = session.query(AuthorCatalogBook).filter_by(author_id=author.id).count()
-            book_count = session.query(Book).filter(
-                or_(
-                    func.lower(Book.author) == author.name.lower(),
-                    func.lower(Book.author) == author.normalized_name.lower()
-                )
-            ).count()
-            rec_count = session.query(Recommendation).filter(
-                or_(
-                    func.lower(Recommendation.author) == author.name.lower(),
-                    func.lower(Recommendation.author) == author.normalized_name.lower()
-                )
-            ).count()
-            
-            # Include even if no data - orphaned credential-only authors should be removed
-            credential_authors.append({
-                'author': author,
-                'catalog_count': catalog_count,
-                'book_count': book_count,
-                'rec_count': rec_count
-            })
+    # Let SQLite narrow the table down to credential-shaped names, stripping exactly
+    # the characters is_credential_only does (dots and all of string.whitespace) so
+    # the prefilter never drops a name the Python check would accept. Only the
+    # columns used below are selected, so rows come back as plain tuples rather
+    # than ORM instances.
+    stripped_name = Author.name
+    for char in '.' + string.whitespace:
+        stripped_name = func.replace(stripped_name, char, '')
+    stripped_name = func.lower(stripped_name)
+    candidate_authors = session.query(
+        Author.id, Author.name, Author.normalized_name, Author.open_library_id
+    ).filter(stripped_name.in_(_CREDENTIALS)).yield_per(1000)
+    authors = [author for author in candidate_authors if is_credential_only(author.name)]
     
-    if not credential_authors:
+    if not authors:
         print("No credential-only authors found!")
         return
     
-    print(f"Found {len(credential_authors)} credential-only authors:\n")
+    print(f"Found {len(authors)} credential-only authors:\n")
     
-    total_catalog = 0
-    total_books = 0
-    total_recs = 0
+    author_ids = [author.id for author in authors]
+    names_by_author = {author.id: {author.name.lower(), author.normalized_name.lower()} for author in authors}
+    lowered_names = set().union(*names_by_author.values())
     
-    for item in credential_authors:
-        author = item['author']
-        print(f"{author.name} (ID: {author.id})")
-        print(f"  Normalized: {author.normalized_name}")
-        print(f"  Open Library ID: {author.open_library_id or 'N/A'}")
-        print(f"  Catalog books: {item['catalog_count']}")
-        print(f"  Books (Libby): {item['book_count']}")
-        print(f"  Recommendations: {item['rec_count']}")
-        
-        # Show sample titles
-        if item['catalog_count'] > 0:
-            sample_books = session.query(AuthorCatalogBook).filter_by(
-                author_id=author.id
-            ).limit(5).all()
-            print(f"  Sample catalog titles:")
-            for book in sample_books:
-                print(f"    - {book.title}")
-        
-        print()
+    if dry_run:
+        # Count associated rows with one GROUP BY per table instead of three COUNTs per author
+        catalog_counts = dict(
+            session.query(AuthorCatalogBook.author_id, func.count())
+            .filter(AuthorCatalogBook.author_id.in_(author_ids))
+            .group_by(AuthorCatalogBook.author_id)
+            .all()
+        )
+        book_counts = dict(
+            session.query(Book.author_lc, func.count())
+            .filter(Book.author_lc.in_(lowered_names))
+            .group_by(Book.author_lc)
+            .all()
+        )
+        rec_counts = dict(
+            session.query(Recommendation.author_lc, func.count())
+            .filter(Recommendation.author_lc.in_(lowered_names))
+            .group_by(Recommendation.author_lc)
+            .all()
+        )
         
-        total_catalog += item['catalog_count']
-        total_books += item['book_count']
-        total_recs += item['rec_count']
-    
-    print("=" * 80)
-    print("SUMMARY")
-    print("=" * 80)
-    print(f"Total credential-only authors: {len(credential_authors)}")
-    print(f"Total catalog books to delete: {total_catalog}")
-    print(f"Total books (Libby) to delete: {total_books}")
-    print(f"Total recommendations to delete: {total_recs}")
-    print()
-    
-    if not dry_run:
-        print("Deleting credential-only authors and associated data...")
-        max_retries = 10
-        authors_deleted = []
+        total_catalog = 0
+        total_books = 0
+        total_recs = 0
         
-        for item in credential_authors:
-            author = item['author']
+        # Include even if no data - orphaned credential-only authors should be removed
+        for author in authors:
+            names = names_by_author[author.id]
+            catalog_count = catalog_counts.get(author.id, 0)
+            book_count = sum(book_counts.get(name, 0) for name in names)
+            rec_count = sum(rec_counts.get(name, 0) for name in names)
+            
+            print(f"{author.name} (ID: {author.id})")
+            print(f"  Normalized: {author.normalized_name}")
+            print(f"  Open Library ID: {author.open_library_id or 'N/A'}")
+            print(f"  Catalog books: {catalog_count}")
+            print(f"  Books (Libby): {book_count}")
+            print(f"  Recommendations: {rec_count}")
+            
+            # Show sample titles
+            if catalog_count > 0:
+                sample_books = session.query(AuthorCatalogBook).filter_by(
+                    author_id=author.id
+                ).limit(5).all()
+                print(f"  Sample catalog titles:")
+                for book in sample_books:
+                    print(f"    - {book.title}")
+            
+            print()
             
-            for attempt in range(max_retries):
-                try:
-                    with session.no_autoflush:
-                        # Delete catalog books
-                        catalog_books = session.query(AuthorCatalogBook).filter_by(author_id=author.id).all()
-                        for catalog_book in catalog_books:
-                            session.delete(catalog_book)
-                        
-                        # Delete books
-                        books = session.query(Book).filter(
-                            or_(
-                                func.lower(Book.author) == author.name.lower(),
-                                func.lower(Book.author) == author.normalized_name.lower()
-                            )
-                        ).all()
-                        for book in books:
-                            session.delete(book)
-                        
-                        # Delete recommendations
-                        recommendations = session.query(Recommendation).filter(
-                            or_(
-                                func.lower(Recommendation.author) == author.name.lower(),
-                                func.lower(Recommendation.author) == author.normalized_name.lower()
-                            )
-                        ).all()
-                        for rec in recommendations:
-                            session.delete(rec)
-                        
-                        # Delete author
-                        session.delete(author)
-                    
-                    session.commit()
-                    authors_deleted.append(author.name)
-                    print(f"✓ Deleted: {author.name}")
-                    break
-                except Exception as e:
-                    error_str = str(e).lower()
-                    if 'locked' in error_str and attempt < max_retries - 1:
-                        session.rollback()
-                        wait_time = 0.1 * (2 ** attempt)
-                        print(f"  Database locked, retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})")
-                        time.sleep(wait_time)
-                        # Re-fetch objects after rollback
-                        catalog_books = session.query(AuthorCatalogBook).filter_by(author_id=author.id).all()
-                        books = session.query(Book).filter(
-                            or_(
-                                func.lower(Book.author) == author.name.lower(),
-                                func.lower(Book.author) == author.normalized_name.lower()
-                            )
-                        ).all()
-                        recommendations = session.query(Recommendation).filter(
-                            or_(
-                                func.lower(Recommendation.author) == author.name.lower(),
-                                func.lower(Recommendation.author) == author.normalized_name.lower()
-                            )
-                        ).all()
-                    else:
-                        session.rollback()
-                        print(f"✗ ERROR: Failed to delete {author.name}: {e}")
-                        raise
+            total_catalog += catalog_count
+            total_books += book_count
+            total_recs += rec_count
+        
+        print("=" * 80)
+        print("SUMMARY")
+        print("=" * 80)
+        print(f"Total credential-only authors: {len(authors)}")
+        print(f"Total catalog books to delete: {total_catalog}")
+        print(f"Total books (Libby) to delete: {total_books}")
+        print(f"Total recommendations to delete: {total_recs}")
+        print()
         
-        print(f"\n{'=' * 80}")
-        print("DELETION COMPLETE")
-        print(f"{'=' * 80}")
-        print(f"Deleted {len(authors_deleted)} authors:")
-        for name in authors_deleted:
-            print(f"  - {name}")
-    else:
         print(f"\n{'=' * 80}")
         print("DRY RUN SUMMARY")
         print(f"{'=' * 80}")
-        print(f"Would delete {len(credential_authors)} authors and all associated data")
+        print(f"Would delete {len(authors)} authors and all associated data")
+        return
+    
+    # Live mode skips the per-author report; the DELETE row counts give the totals
+    print("Deleting credential-only authors and associated data...")
+    max_retries = 3  # init_db sets busy_timeout/WAL; this only covers a lock that outlasts it
+    authors_deleted = [author.name for author in authors]
+    
+    # One transaction for every author: a single DELETE per table keyed by
+    # the author ids / lowered names collected during the scan
+    for attempt in range(max_retries):
+        try:
+            with session.no_autoflush:
+                # Delete catalog books
+                total_catalog = session.query(AuthorCatalogBook).filter(
+                    AuthorCatalogBook.author_id.in_(author_ids)
+                ).delete(synchronize_session=False)
+                
+                # Delete books
+                total_books = session.query(Book).filter(
+                    Book.author_lc.in_(lowered_names)
+                ).delete(synchronize_session=False)
+                
+                # Delete recommendations
+                total_recs = session.query(Recommendation).filter(
+                    Recommendation.author_lc.in_(lowered_names)
+                ).delete(synchronize_session=False)
+                
+                # Delete authors
+                session.query(Author).filter(
+                    Author.id.in_(author_ids)
+                ).delete(synchronize_session=False)
+            
+            session.commit()
+            for name in authors_deleted:
+                print(f"✓ Deleted: {name}")
+            break
+        except Exception as e:
+            if is_database_locked(e) and attempt < max_retries - 1:
+                session.rollback()
+                wait_time = 0.1 * (2 ** attempt) * random.uniform(0.5, 1.5)  # Jitter so concurrent runs don't retry in lockstep
+                print(f"  Database locked, retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})")
+                time.sleep(wait_time)
+            else:
+                session.rollback()
+                print(f"✗ ERROR: Failed to delete credential-only authors: {e}")
+                raise
+    
+    print(f"\n{'=' * 80}")
+    print("DELETION COMPLETE")
+    print(f"{'=' * 80}")
+    print(f"Deleted {len(authors_deleted)} authors:")
+    for name in authors_deleted:
+        print(f"  - {name}")
+    print(f"\nCatalog books deleted: {total_catalog}")
+    print(f"Books (Libby) deleted: {total_books}")
+    print(f"Recommendations deleted: {total_recs}")
 
 
 if __name__ == '__main__':
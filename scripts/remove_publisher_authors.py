@@ -6,8 +6,9 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.models import init_db, get_session, Author, AuthorCatalogBook, Book, Recommendation
+from src.models import init_db, get_session, is_database_locked, Author, AuthorCatalogBook, Book, Recommendation
 from sqlalchemy import or_, func
+import random
 import time
 
 
@@ -42,21 +43,33 @@ def remove_author_by_name(author_names, dry_run=True):
     total_recommendations_deleted = 0
     authors_deleted = []
     
-    # Find all authors to remove by name (case-insensitive, supports partial matches)
-    authors_to_remove = []
+    # Find all authors to remove by name (case-insensitive). Exact matches on
+    # name/normalized_name can use the lower() indexes; only names with no exact
+    # match fall back to a substring LIKE, which has to scan the table.
+    names_lower = {name.lower() for name in author_names_to_remove}
+    authors_to_remove = session.query(Author).filter(
+        or_(
+            func.lower(Author.name).in_(names_lower),
+            func.lower(Author.normalized_name).in_(names_lower)
+        )
+    ).all()
     
-    for name in author_names_to_remove:
-        authors = session.query(Author).filter(
-            or_(
-                func.lower(Author.name) == name.lower(),
-                func.lower(Author.normalized_name) == name.lower(),
-                func.lower(Author.name).like(f'%{name.lower()}%'),
-                func.lower(Author.normalized_name).like(f'%{name.lower()}%')
-            )
-        ).all()
-        for author in authors:
-            if author not in authors_to_remove:
-                authors_to_remove.append(author)
+    matched_names = set()
+    for author in authors_to_remove:
+        matched_names.update((author.name.lower(), author.normalized_name.lower()))
+    unmatched_names = names_lower - matched_names
+    
+    if unmatched_names:
+        found_ids = [author.id for author in authors_to_remove]
+        conditions = []
+        for name_lower in unmatched_names:
+            conditions.extend([
+                func.lower(Author.name).like(f'%{name_lower}%'),
+                func.lower(Author.normalized_name).like(f'%{name_lower}%')
+            ])
+        authors_to_remove.extend(
+            session.query(Author).filter(or_(*conditions), Author.id.notin_(found_ids)).all()
+        )
     
     if not authors_to_remove:
         print("No authors found to remove.")
@@ -65,30 +78,23 @@ def remove_author_by_name(author_names, dry_run=True):
     for author in authors_to_remove:
         print(f"\n--- Processing: {author.name} (ID: {author.id}) ---")
         print(f"   Normalized: {author.normalized_name}")
+        name_lower = author.name.lower()
+        normalized_lower = author.normalized_name.lower()
         
         # Count catalog books
-        catalog_books = session.query(AuthorCatalogBook).filter_by(author_id=author.id).all()
-        catalog_count = len(catalog_books)
+        catalog_count = session.query(AuthorCatalogBook).filter_by(author_id=author.id).count()
         print(f"   Catalog books: {catalog_count}")
         
         # Count books from Book table
-        books = session.query(Book).filter(
-            or_(
-                func.lower(Book.author) == author.normalized_name.lower(),
-                func.lower(Book.author) == author.name.lower()
-            )
-        ).all()
-        book_count = len(books)
+        book_count = session.query(Book).filter(
+            Book.author_lc.in_([normalized_lower, name_lower])
+        ).count()
         print(f"   Books read (from Libby): {book_count}")
         
         # Count recommendations
-        recommendations = session.query(Recommendation).filter(
-            or_(
-                func.lower(Recommendation.author) == author.name.lower(),
-                func.lower(Recommendation.author) == author.normalized_name.lower()
-            )
-        ).all()
-        rec_count = len(recommendations)
+        rec_count = session.query(Recommendation).filter(
+            Recommendation.author_lc.in_([name_lower, normalized_lower])
+        ).count()
         print(f"   Recommendations: {rec_count}")
         
         # Update totals
@@ -98,21 +104,24 @@ def remove_author_by_name(author_names, dry_run=True):
         
         if not dry_run:
             # Delete in batches with retry logic
-            max_retries = 10
+            max_retries = 3  # init_db sets busy_timeout/WAL; this only covers a lock that outlasts it
             for attempt in range(max_retries):
                 try:
                     with session.no_autoflush:
                         # Delete catalog books
-                        for catalog_book in catalog_books:
-                            session.delete(catalog_book)
+                        session.query(AuthorCatalogBook).filter_by(
+                            author_id=author.id
+                        ).delete(synchronize_session=False)
                         
                         # Delete books from Book table
-                        for book in books:
-                            session.delete(book)
+                        session.query(Book).filter(
+                            Book.author_lc.in_([normalized_lower, name_lower])
+                        ).delete(synchronize_session=False)
                         
                         # Delete recommendations
-                        for rec in recommendations:
-                            session.delete(rec)
+                        session.query(Recommendation).filter(
+                            Recommendation.author_lc.in_([name_lower, normalized_lower])
+                        ).delete(synchronize_session=False)
                         
                         # Delete author
                         session.delete(author)
@@ -123,26 +132,11 @@ def remove_author_by_name(author_names, dry_run=True):
                     print(f"   ✓ Deleted")
                     break
                 except Exception as e:
-                    error_str = str(e).lower()
-                    if 'locked' in error_str and attempt < max_retries - 1:
+                    if is_database_locked(e) and attempt < max_retries - 1:
                         session.rollback()
-                        wait_time = 0.1 * (2 ** attempt)  # Exponential backoff
+                        wait_time = 0.1 * (2 ** attempt) * random.uniform(0.5, 1.5)  # Exponential backoff with jitter
                         print(f"   Database locked, retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})")
                         time.sleep(wait_time)
-                        # Re-fetch objects after rollback
-                        catalog_books = session.query(AuthorCatalogBook).filter_by(author_id=author.id).all()
-                        books = session.query(Book).filter(
-                            or_(
-                                func.lower(Book.author) == author.normalized_name.lower(),
-                                func.lower(Book.author) == author.name.lower()
-                            )
-                        ).all()
-                        recommendations = session.query(Recommendation).filter(
-                            or_(
-                                func.lower(Recommendation.author) == author.name.lower(),
-                                func.lower(Recommendation.author) == author.normalized_name.lower()
-                            )
-                        ).all()
                     else:
                         session.rollback()
                         print(f"\nERROR: Failed to delete {author.name}: {e}")
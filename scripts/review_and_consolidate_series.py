@@ -9,47 +9,93 @@ Interactive workflow:
 """
 
 import sys
+import pickle
 from pathlib import Path
-from typing import List, Dict
+from collections import Counter, defaultdict
+from typing import List, Dict, Tuple
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.models import init_db, get_session, AuthorCatalogBook, Author
+from src.models import init_db, get_session, find_author_by_name, AuthorCatalogBook
 from scripts.consolidate_series import (
     scan_all_authors, find_series_consolidations,
-    normalize_series_name, execute_consolidation
+    normalize_series_name
 )
+from sqlalchemy import case
 
 
-def collect_all_consolidations(min_books: int = 1, limit: int = None) -> List[Dict]:
+CACHE_PATH = Path(__file__).parent.parent / 'data' / 'cache' / 'series_consolidations.pkl'
+# Bump when the cached consolidation dicts change shape
+_CACHE_FORMAT = 1
+
+
+def _cache_key(min_books: int, limit: int) -> tuple:
+    """
+    Cache key for a scan: changes whenever the database (or its WAL file) is written.
+    """
+    db_path = Path(__file__).parent.parent / 'data' / 'bookpilot.db'
+    stamps = []
+    for path in (db_path, db_path.with_name(db_path.name + '-wal')):
+        try:
+            stat = path.stat()
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            stamps.append(None)
+    return (_CACHE_FORMAT, tuple(stamps), min_books, limit)
+
+
+def _load_cached_consolidations(cache_key: tuple):
+    """Load consolidations from the last scan if the database hasn't changed since"""
+    try:
+        with open(CACHE_PATH, 'rb') as f:
+            cached = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get('key') != cache_key:
+        return None
+    return cached['consolidations']
+
+
+def _save_cached_consolidations(cache_key: tuple, consolidations: List[Dict]):
+    """Save scan results for the next invocation"""
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_PATH, 'wb') as f:
+            pickle.dump({'key': cache_key, 'consolidations': consolidations}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
+def collect_all_consolidations(min_books: int = 1, limit: int = None, use_cache: bool = True) -> List[Dict]:
     """
     Collect all series consolidations across all authors.
     Returns a flat list with numbering.
-    """
-    results = scan_all_authors(min_books=min_books, limit=limit)
     
+    Results are cached in data/cache/ until the database changes, so repeated
+    previews only scan once. Callers that write to the database pass
+    use_cache=False so they never act on groups from an earlier scan.
+    """
+    # Take the key before scanning: opening the database can itself touch the file
+    cache_key = _cache_key(min_books, limit)
+    if use_cache:
+        cached = _load_cached_consolidations(cache_key)
+        if cached is not None:
+            print("(Using cached scan results - pass --no-cache to rescan)")
+            return cached
+    
+    # Number each author's groups in place as the scan results come in,
+    # rather than copying every group into a second dict
     all_consolidations = []
-    global_number = 1
-    
-    for result in results:
+    for result in scan_all_authors(min_books=min_books, limit=limit):
         author = result['author']
-        consolidations = result['consolidations']
-        
-        for consolidation in consolidations:
-            all_consolidations.append({
-                'number': global_number,
-                'author': author.name,
-                'author_id': author.id,
-                'consolidation': consolidation,
-                'canonical_name': consolidation['canonical_name'],
-                'variant_names': consolidation['variant_names'],
-                'normalized_name': consolidation['normalized_name'],
-                'books': consolidation['books'],
-                'confidence': consolidation['confidence'],
-                'positions': consolidation['positions']
-            })
-            global_number += 1
+        for consolidation in result['consolidations']:
+            consolidation.update(number=len(all_consolidations) + 1, author=author.name, author_id=author.id)
+            all_consolidations.append(consolidation)
+    
+    if use_cache:
+        _save_cached_consolidations(cache_key, all_consolidations)
     
     return all_consolidations
 
@@ -58,101 +104,107 @@ def preview_consolidations(consolidations: List[Dict]):
     """
     Show numbered preview of all series consolidations.
     """
-    print("="*80)
-    print(f"SERIES CONSOLIDATION PREVIEW")
-    print(f"Total: {len(consolidations)} consolidation groups found")
-    print("="*80)
-    print()
-    
-    # Group by author for summary
-    by_author = {}
-    for cons in consolidations:
-        author = cons['author']
-        if author not in by_author:
-            by_author[author] = []
-        by_author[author].append(cons)
-    
-    print("Breakdown by author:")
-    for author, cons_list in sorted(by_author.items(), key=lambda x: len(x[1]), reverse=True):
-        print(f"  {author}: {len(cons_list)} consolidation group(s)")
-    print()
+    # Build the whole preview and write it once; per-line print() is slow for large lists
+    lines = [
+        "="*80,
+        f"SERIES CONSOLIDATION PREVIEW",
+        f"Total: {len(consolidations)} consolidation groups found",
+        "="*80,
+        ""
+    ]
+    
+    # Count groups per author for summary
+    by_author = Counter(cons['author'] for cons in consolidations)
+    
+    lines.append("Breakdown by author:")
+    for author, count in by_author.most_common():
+        lines.append(f"  {author}: {count} consolidation group(s)")
+    lines.append("")
     
     # Show numbered list
-    print("="*80)
-    print("NUMBERED LIST OF SERIES CONSOLIDATIONS")
-    print("="*80)
-    print()
+    lines.extend([
+        "="*80,
+        "NUMBERED LIST OF SERIES CONSOLIDATIONS",
+        "="*80,
+        ""
+    ])
     
     for cons in consolidations:
         num = cons['number']
-        consolidation = cons['consolidation']
         canonical = cons['canonical_name']
         variants = cons['variant_names']
         books = cons['books']
         confidence = cons['confidence']
         positions = cons['positions']
         
-        print(f"{num:4d}. [{cons['author']}] Normalized: \"{cons['normalized_name']}\"")
-        print(f"      Canonical name: \"{canonical}\"")
-        print(f"      Variants to merge: {len(variants)}")
+        lines.append(f"{num:4d}. [{cons['author']}] Normalized: \"{cons['normalized_name']}\"")
+        lines.append(f"      Canonical name: \"{canonical}\"")
+        lines.append(f"      Variants to merge: {len(variants)}")
         for variant in variants:
             if variant != canonical:
-                print(f"         - \"{variant}\" → \"{canonical}\"")
-        print(f"      Confidence: {confidence}")
-        print(f"      Total books: {len(books)}")
+                lines.append(f"         - \"{variant}\" → \"{canonical}\"")
+        lines.append(f"      Confidence: {confidence}")
+        lines.append(f"      Total books: {len(books)}")
         if positions:
-            print(f"      Series positions: {positions}")
-        print(f"      Books:")
-        for book in sorted(books, key=lambda x: x.series_position or 999):
-            variant_marker = " ⚠" if book.series_name != canonical else ""
-            print(f"         #{book.series_position or '?'}: {book.title}")
+            lines.append(f"      Series positions: {positions}")
+        lines.append(f"      Books:")
+        for book in books:
+            lines.append(f"         #{book.series_position or '?'}: {book.title}")
             if book.series_name != canonical:
-                print(f"            Current series: \"{book.series_name}\" → will change to \"{canonical}\"")
-        print()
+                lines.append(f"            Current series: \"{book.series_name}\" → will change to \"{canonical}\"")
+        lines.append("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def execute_consolidations(consolidations: List[Dict], keep_numbers: List[int] = None, dry_run: bool = True):
+def execute_consolidations(consolidations: List[Dict], keep_numbers: List[int] = None, dry_run: bool = True,
+                           print_summary: bool = True, partition: Tuple[List[Dict], List[Dict]] = None):
     """
     Execute series consolidations, optionally keeping specific ones.
-    """
-    keep_numbers_set = set(keep_numbers) if keep_numbers else set()
-    
-    to_consolidate = []
-    to_keep = []
     
-    for cons in consolidations:
-        if cons['number'] in keep_numbers_set:
-            to_keep.append(cons)
-        else:
-            to_consolidate.append(cons)
-    
-    print("="*80)
-    print("CONSOLIDATION SUMMARY")
-    print("="*80)
-    print(f"\nTotal consolidation groups: {len(consolidations)}")
-    print(f"Groups to CONSOLIDATE: {len(to_consolidate)}")
-    print(f"Groups to KEEP (skip): {len(to_keep)}")
-    
-    if to_keep:
-        print(f"\nGroups to KEEP (skip consolidation):")
-        for cons in to_keep:
-            print(f"  {cons['number']:4d}. [{cons['author']}] \"{cons['normalized_name']}\"")
-    
-    if to_consolidate:
-        print(f"\nGroups to CONSOLIDATE:")
-        total_books_to_update = 0
-        for cons in to_consolidate[:20]:  # Show first 20
-            books_to_update = sum(1 for b in cons['books'] 
-                                if b.series_name != cons['canonical_name'])
-            total_books_to_update += books_to_update
-            print(f"  {cons['number']:4d}. [{cons['author']}] \"{cons['normalized_name']}\" → \"{cons['canonical_name']}\" ({books_to_update} books)")
-        if len(to_consolidate) > 20:
-            print(f"  ... and {len(to_consolidate) - 20} more")
-        print(f"\n  Total books to update: {total_books_to_update}")
+    Pass print_summary=False to skip the summary when it has already been shown.
+    Returns the (to_consolidate, to_keep) split; pass it back as partition to reuse
+    it (e.g. from the dry run) instead of splitting the consolidations again.
+    """
+    if partition is not None:
+        to_consolidate, to_keep = partition
+    else:
+        keep_numbers_set = set(keep_numbers) if keep_numbers else set()
+        
+        to_consolidate = []
+        to_keep = []
+        
+        for cons in consolidations:
+            if cons['number'] in keep_numbers_set:
+                to_keep.append(cons)
+            else:
+                to_consolidate.append(cons)
+    
+    if print_summary:
+        print("="*80)
+        print("CONSOLIDATION SUMMARY")
+        print("="*80)
+        print(f"\nTotal consolidation groups: {len(consolidations)}")
+        print(f"Groups to CONSOLIDATE: {len(to_consolidate)}")
+        print(f"Groups to KEEP (skip): {len(to_keep)}")
+        
+        if to_keep:
+            print(f"\nGroups to KEEP (skip consolidation):")
+            for cons in to_keep:
+                print(f"  {cons['number']:4d}. [{cons['author']}] \"{cons['normalized_name']}\"")
+        
+        if to_consolidate:
+            print(f"\nGroups to CONSOLIDATE:")
+            total_books_to_update = sum(cons['update_count'] for cons in to_consolidate)
+            for cons in to_consolidate[:20]:  # Show first 20
+                print(f"  {cons['number']:4d}. [{cons['author']}] \"{cons['normalized_name']}\" → \"{cons['canonical_name']}\" ({cons['update_count']} books)")
+            if len(to_consolidate) > 20:
+                print(f"  ... and {len(to_consolidate) - 20} more")
+            print(f"\n  Total books to update: {total_books_to_update}")
     
     if dry_run:
         print("\n(DRY RUN - no changes will be made)")
-        return
+        return to_consolidate, to_keep
     
     # Actually consolidate
     db_path = Path(__file__).parent.parent / 'data' / 'bookpilot.db'
@@ -162,16 +214,31 @@ def execute_consolidations(consolidations: List[Dict], keep_numbers: List[int] =
     print("\nConsolidating series...")
     updated_total = 0
     
+    # Merge every group's variant -> canonical renames per author, so each
+    # author needs a single UPDATE ... SET series_name = CASE series_name ... END
+    renames_by_author = defaultdict(dict)
     for cons in to_consolidate:
-        consolidation = cons['consolidation']
-        updated = execute_consolidation(consolidation, session, dry_run=False)
-        updated_total += updated
+        canonical = cons['canonical_name']
+        for variant in cons['variant_names']:
+            if variant != canonical:
+                renames_by_author[cons['author_id']][variant] = canonical
+    
+    for author_id, renames in renames_by_author.items():
+        updated_total += session.query(AuthorCatalogBook).filter(
+            AuthorCatalogBook.author_id == author_id,
+            AuthorCatalogBook.series_name.in_(list(renames))
+        ).update(
+            {AuthorCatalogBook.series_name: case(renames, value=AuthorCatalogBook.series_name)},
+            synchronize_session=False
+        )
     
     session.commit()
     print(f"✓ Consolidated {len(to_consolidate)} series groups")
     print(f"✓ Updated {updated_total} catalog books")
     
     session.close()
+    
+    return to_consolidate, to_keep
 
 
 def interactive_review():
@@ -218,33 +285,21 @@ def interactive_review():
         engine = init_db(str(db_path))
         session = get_session(engine)
         
-        author = session.query(Author).filter(
-            Author.name.ilike(f'%{author_name}%')
-        ).first()
+        author = find_author_by_name(session, author_name)
         
         if not author:
             print(f"Author '{author_name}' not found.")
             session.close()
             return
         
-        consolidations_list = find_series_consolidations(author, session)
-        consolidations = []
-        for i, consolidation in enumerate(consolidations_list, 1):
-            consolidations.append({
-                'number': i,
-                'author': author.name,
-                'author_id': author.id,
-                'consolidation': consolidation,
-                'canonical_name': consolidation['canonical_name'],
-                'variant_names': consolidation['variant_names'],
-                'normalized_name': consolidation['normalized_name'],
-                'books': consolidation['books'],
-                'confidence': consolidation['confidence'],
-                'positions': consolidation['positions']
-            })
+        consolidations = find_series_consolidations(author, session)
+        # Number the groups in place; they already carry every other preview field
+        for i, consolidation in enumerate(consolidations, 1):
+            consolidation.update(number=i, author=author.name, author_id=author.id)
         session.close()
     else:
-        consolidations = collect_all_consolidations(min_books=min_books, limit=limit)
+        # Fresh scan: these groups may be consolidated below
+        consolidations = collect_all_consolidations(min_books=min_books, limit=limit, use_cache=False)
     
     if not consolidations:
         print("No series consolidations found.")
@@ -292,7 +347,7 @@ def interactive_review():
     print("\n" + "="*80)
     print("DRY RUN PREVIEW")
     print("="*80)
-    execute_consolidations(consolidations, keep_numbers=keep_numbers, dry_run=True)
+    partition = execute_consolidations(consolidations, keep_numbers=keep_numbers, dry_run=True)
     
     # Final confirmation
     final_confirm = input("\nProceed with consolidation? (yes/no): ").strip().lower()
@@ -304,7 +359,9 @@ def interactive_review():
     print("\n" + "="*80)
     print("EXECUTING CONSOLIDATION")
     print("="*80)
-    execute_consolidations(consolidations, keep_numbers=keep_numbers, dry_run=False)
+    # (the dry run above already printed the summary and split the groups)
+    execute_consolidations(consolidations, keep_numbers=keep_numbers, dry_run=False, print_summary=False,
+                           partition=partition)
 
 
 if __name__ == '__main__':
@@ -328,6 +385,8 @@ if __name__ == '__main__':
                        help='Limit number of authors to process')
     parser.add_argument('--author', type=str,
                        help='Check specific author by name')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Rescan the database instead of reusing cached scan results')
     
     args = parser.parse_args()
     
@@ -340,33 +399,21 @@ if __name__ == '__main__':
             engine = init_db(str(db_path))
             session = get_session(engine)
             
-            author = session.query(Author).filter(
-                Author.name.ilike(f'%{args.author}%')
-            ).first()
+            author = find_author_by_name(session, args.author)
             
             if not author:
                 print(f"Author '{args.author}' not found.")
                 session.close()
                 sys.exit(1)
             
-            consolidations_list = find_series_consolidations(author, session)
-            consolidations = []
-            for i, consolidation in enumerate(consolidations_list, 1):
-                consolidations.append({
-                    'number': i,
-                    'author': author.name,
-                    'author_id': author.id,
-                    'consolidation': consolidation,
-                    'canonical_name': consolidation['canonical_name'],
-                    'variant_names': consolidation['variant_names'],
-                    'normalized_name': consolidation['normalized_name'],
-                    'books': consolidation['books'],
-                    'confidence': consolidation['confidence'],
-                    'positions': consolidation['positions']
-                })
+            consolidations = find_series_consolidations(author, session)
+            # Number the groups in place; they already carry every other preview field
+            for i, consolidation in enumerate(consolidations, 1):
+                consolidation.update(number=i, author=author.name, author_id=author.id)
             session.close()
         else:
-            consolidations = collect_all_consolidations(min_books=args.min_books, limit=args.limit)
+            consolidations = collect_all_consolidations(min_books=args.min_books, limit=args.limit,
+                                                        use_cache=not args.no_cache)
         
         preview_consolidations(consolidations)
     elif args.consolidate_all or args.keep:
@@ -378,5 +425,7 @@ if __name__ == '__main__':
                 print("Error: Invalid keep list. Use comma-separated numbers (e.g., '5, 12')")
                 sys.exit(1)
         
-        consolidations = collect_all_consolidations(min_books=args.min_books, limit=args.limit)
+        # --execute always rescans, so it never acts on cached groups from an earlier scan
+        consolidations = collect_all_consolidations(min_books=args.min_books, limit=args.limit,
+                                                    use_cache=not (args.no_cache or args.execute))
         execute_consolidations(consolidations, keep_numbers=keep_numbers, dry_run=not args.execute)
@@ -10,12 +10,13 @@ Interactive workflow:
 
 import sys
 from pathlib import Path
+from collections import Counter
 from typing import List, Dict
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.models import init_db, get_session, Recommendation, Author, AuthorCatalogBook
+from src.models import init_db, get_session, find_author_by_name, Recommendation, AuthorCatalogBook
 from scripts.detect_childrens_books import scan_all_authors, analyze_author_childrens_books
 from sqlalchemy import func
 from src.deduplication.language_detection import is_english_title
@@ -55,43 +56,45 @@ def preview_childrens_books(childrens_books: List[Dict]):
     """
     Show numbered preview of all children's books.
     """
-    print("="*80)
-    print(f"CHILDREN'S BOOKS PREVIEW")
-    print(f"Total: {len(childrens_books)} children's books found")
-    print("="*80)
-    print()
-    
-    # Group by author for summary
-    by_author = {}
-    for book in childrens_books:
-        author = book['author']
-        if author not in by_author:
-            by_author[author] = []
-        by_author[author].append(book)
-    
-    print("Breakdown by author:")
-    for author, books in sorted(by_author.items(), key=lambda x: len(x[1]), reverse=True):
-        print(f"  {author}: {len(books)} children's books")
-    print()
+    # Build the whole preview and write it once; per-line print() is slow for large lists
+    lines = [
+        "="*80,
+        f"CHILDREN'S BOOKS PREVIEW",
+        f"Total: {len(childrens_books)} children's books found",
+        "="*80,
+        ""
+    ]
+    
+    # Count books per author for summary
+    by_author = Counter(book['author'] for book in childrens_books)
+    
+    lines.append("Breakdown by author:")
+    for author, count in by_author.most_common():
+        lines.append(f"  {author}: {count} children's books")
+    lines.append("")
     
     # Show numbered list
-    print("="*80)
-    print("NUMBERED LIST OF CHILDREN'S BOOKS")
-    print("="*80)
-    print()
+    lines.extend([
+        "="*80,
+        "NUMBERED LIST OF CHILDREN'S BOOKS",
+        "="*80,
+        ""
+    ])
     
     for book in childrens_books:
         num = book['number']
         catalog_book = book['catalog_book']
         reasons = book['reasons']
         
-        print(f"{num:4d}. [{book['author']}] {catalog_book.title}")
+        lines.append(f"{num:4d}. [{book['author']}] {catalog_book.title}")
         if catalog_book.isbn:
-            print(f"      ISBN: {catalog_book.isbn}")
+            lines.append(f"      ISBN: {catalog_book.isbn}")
         if catalog_book.categories:
-            print(f"      Categories: {catalog_book.categories}")
-        print(f"      Reasons: {', '.join(reasons)}")
-        print()
+            lines.append(f"      Categories: {catalog_book.categories}")
+        lines.append(f"      Reasons: {', '.join(reasons)}")
+        lines.append("")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def delete_childrens_books(childrens_books: List[Dict], keep_numbers: List[int] = None, dry_run: bool = True):
@@ -140,11 +143,12 @@ def delete_childrens_books(childrens_books: List[Dict], keep_numbers: List[int]
     print("\nDeleting children's catalog books...")
     deleted_count = 0
     
-    for book in to_flag:
-        catalog_book = session.query(AuthorCatalogBook).filter_by(id=book['catalog_book_id']).first()
-        if catalog_book:
-            session.delete(catalog_book)
-            deleted_count += 1
+    # One DELETE per chunk of ids (chunked to stay under SQLite's bound-parameter limit)
+    catalog_book_ids = [book['catalog_book_id'] for book in to_flag]
+    for start in range(0, len(catalog_book_ids), 500):
+        deleted_count += session.query(AuthorCatalogBook).filter(
+            AuthorCatalogBook.id.in_(catalog_book_ids[start:start + 500])
+        ).delete(synchronize_session=False)
     
     session.commit()
     print(f"✓ Deleted {deleted_count} children's catalog books")
@@ -196,9 +200,7 @@ def interactive_review():
         engine = init_db(str(db_path))
         session = get_session(engine)
         
-        author = session.query(Author).filter(
-            Author.name.ilike(f'%{author_name}%')
-        ).first()
+        author = find_author_by_name(session, author_name)
         
         if not author:
             print(f"Author '{author_name}' not found.")
@@ -308,16 +310,14 @@ if __name__ == '__main__':
     
     if args.interactive:
         interactive_review()
-    elif args.preview_only or (not args.flag_all and not args.keep):
+    elif args.preview_only or (not args.delete_all and not args.keep):
         # Default: just preview
         if args.author:
             db_path = Path(__file__).parent.parent / 'data' / 'bookpilot.db'
             engine = init_db(str(db_path))
             session = get_session(engine)
             
-            author = session.query(Author).filter(
-                Author.name.ilike(f'%{args.author}%')
-            ).first()
+            author = find_author_by_name(session, args.author)
             
             if not author:
                 print(f"Author '{args.author}' not found.")
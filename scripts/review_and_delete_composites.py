@@ -11,7 +11,8 @@ Interactive workflow:
 import sys
 import json
 from pathlib import Path
-from typing import List, Dict
+from collections import Counter
+from typing import Any, List, Dict, NamedTuple, Optional
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -23,7 +24,40 @@ from scripts.detect_composite_volumes import (
 )
 
 
-def collect_all_composites(min_books: int = 1, limit: int = None) -> List[Dict]:
+class CompositeEntry(NamedTuple):
+    """A numbered composite volume in the review list"""
+    number: int
+    author: str
+    author_id: int
+    composite: Any
+    composite_id: int
+    composite_series_name: Optional[str]
+    composite_series_position: Optional[int]
+    standalone_books: list
+    component_titles: list
+    confidence: str
+    reason: str
+
+
+def make_composite_entry(number: int, author: Author, match: Dict) -> CompositeEntry:
+    """Build a review entry from a detect_composite_volumes match"""
+    composite = match['composite_book']
+    return CompositeEntry(
+        number=number,
+        author=author.name,
+        author_id=author.id,
+        composite=composite,
+        composite_id=composite.id,
+        composite_series_name=match.get('composite_series_name'),
+        composite_series_position=match.get('composite_series_position'),
+        standalone_books=match['standalone_books'],
+        component_titles=match['component_titles'],
+        confidence=match['confidence'],
+        reason=match['reason']
+    )
+
+
+def collect_all_composites(min_books: int = 1, limit: int = None) -> List[CompositeEntry]:
     """
     Collect all composite volumes across all authors.
     Returns a flat list with numbering.
@@ -35,100 +69,92 @@ def collect_all_composites(min_books: int = 1, limit: int = None) -> List[Dict]:
     
     for result in results:
         author = result['author']
-        matches = result['matches']
         
-        for match in matches:
-            composite = match['composite_book']
-            standalones = match['standalone_books']
-            
-            all_composites.append({
-                'number': global_number,
-                'author': author.name,
-                'author_id': author.id,
-                'composite': composite,
-                'composite_id': composite.id,
-                'composite_series_name': match.get('composite_series_name'),
-                'composite_series_position': match.get('composite_series_position'),
-                'standalone_books': standalones,
-                'component_titles': match['component_titles'],
-                'confidence': match['confidence'],
-                'reason': match['reason']
-            })
+        for match in result['matches']:
+            all_composites.append(make_composite_entry(global_number, author, match))
             global_number += 1
     
     return all_composites
 
 
-def preview_composites(composites: List[Dict], show_all: bool = False):
+def preview_composites(composites: List[CompositeEntry], show_all: bool = False):
     """
     Show numbered preview of all composite volumes.
     """
-    print("="*80)
-    print(f"COMPOSITE VOLUMES PREVIEW")
-    print(f"Total: {len(composites)} composite volumes found")
-    print("="*80)
-    print()
-    
-    # Group by author for summary
-    by_author = {}
-    for comp in composites:
-        author = comp['author']
-        if author not in by_author:
-            by_author[author] = []
-        by_author[author].append(comp)
-    
-    print("Breakdown by author:")
-    for author, comps in sorted(by_author.items(), key=lambda x: len(x[1]), reverse=True):
-        print(f"  {author}: {len(comps)} composite volumes")
-    print()
+    # Buffer the preview and write it in blocks; per-line print() is slow for large lists
+    lines = [
+        "="*80,
+        f"COMPOSITE VOLUMES PREVIEW",
+        f"Total: {len(composites)} composite volumes found",
+        "="*80,
+        ""
+    ]
+    
+    # Count composites per author for summary
+    by_author = Counter(comp.author for comp in composites)
+    
+    lines.append("Breakdown by author:")
+    for author, count in by_author.most_common():
+        lines.append(f"  {author}: {count} composite volumes")
+    lines.append("")
     
     # Show numbered list
-    print("="*80)
-    print("NUMBERED LIST OF COMPOSITE VOLUMES")
-    print("="*80)
-    print()
-    
-    for comp in composites:
-        num = comp['number']
-        composite = comp['composite']
-        standalones = comp['standalone_books']
-        confidence = comp['confidence']
+    lines.extend([
+        "="*80,
+        "NUMBERED LIST OF COMPOSITE VOLUMES",
+        "="*80,
+        ""
+    ])
+    
+    for count, comp in enumerate(composites, 1):
+        num = comp.number
+        composite = comp.composite
+        standalones = comp.standalone_books
+        confidence = comp.confidence
         
-        print(f"{num:4d}. [{comp['author']}] {composite.title}")
+        lines.append(f"{num:4d}. [{comp.author}] {composite.title}")
         if composite.isbn:
-            print(f"      ISBN: {composite.isbn}")
-        if comp.get('composite_series_name'):
-            print(f"      Series: {comp['composite_series_name']} #{comp.get('composite_series_position', '?')}")
-        print(f"      Confidence: {confidence}")
-        print(f"      Reason: {comp['reason']}")
+            lines.append(f"      ISBN: {composite.isbn}")
+        if comp.composite_series_name:
+            lines.append(f"      Series: {comp.composite_series_name} #{comp.composite_series_position or '?'}")
+        lines.append(f"      Confidence: {confidence}")
+        lines.append(f"      Reason: {comp.reason}")
         
         if standalones:
-            print(f"      Matched {len(standalones)} standalone catalog book(s):")
+            lines.append(f"      Matched {len(standalones)} standalone catalog book(s):")
             for i, standalone_info in enumerate(standalones, 1):
                 standalone = standalone_info['standalone']
                 match_score = standalone_info['match_score']
-                print(f"         {i}. {standalone.title} (match: {match_score:.0%})")
+                lines.append(f"         {i}. {standalone.title} (match: {match_score:.0%})")
                 if standalone.isbn:
-                    print(f"            ISBN: {standalone.isbn}")
+                    lines.append(f"            ISBN: {standalone.isbn}")
         else:
-            print(f"      No matching standalone catalog books found")
-        print()
+            lines.append(f"      No matching standalone catalog books found")
+        lines.append("")
+        
+        if count % 1000 == 0:
+            sys.stdout.write("\n".join(lines) + "\n")
+            lines.clear()
+    
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
-def delete_composites(composites: List[Dict], keep_numbers: List[int] = None, dry_run: bool = True):
+def delete_composites(composites: List[CompositeEntry], keep_numbers: List[int] = None, dry_run: bool = True):
     """
     Delete composite volumes, optionally keeping specific ones.
     """
-    keep_numbers_set = set(keep_numbers) if keep_numbers else set()
+    keep_numbers_set = frozenset(keep_numbers or ())
     
     to_delete = []
     to_keep = []
     
-    for comp in composites:
-        if comp['number'] in keep_numbers_set:
-            to_keep.append(comp)
-        else:
-            to_delete.append(comp)
+    if keep_numbers_set:
+        for comp in composites:
+            (to_keep if comp.number in keep_numbers_set else to_delete).append(comp)
+    else:
+        # Nothing kept - every composite is deleted, no need to test each one
+        to_delete = list(composites)
     
     print("="*80)
     print("DELETION SUMMARY")
@@ -140,12 +166,12 @@ def delete_composites(composites: List[Dict], keep_numbers: List[int] = None, dr
     if to_keep:
         print(f"\nComposite volumes to KEEP:")
         for comp in to_keep:
-            print(f"  {comp['number']:4d}. [{comp['author']}] {comp['composite'].title}")
+            print(f"  {comp.number:4d}. [{comp.author}] {comp.composite.title}")
     
     if to_delete:
         print(f"\nComposite volumes to DELETE:")
         for comp in to_delete[:20]:  # Show first 20
-            print(f"  {comp['number']:4d}. [{comp['author']}] {comp['composite'].title}")
+            print(f"  {comp.number:4d}. [{comp.author}] {comp.composite.title}")
         if len(to_delete) > 20:
             print(f"  ... and {len(to_delete) - 20} more")
     
@@ -162,28 +188,33 @@ def delete_composites(composites: List[Dict], keep_numbers: List[int] = None, dr
     deleted_count = 0
     updated_count = 0
     
+    # Delete the composite catalog books so only the standalone versions remain,
+    # one DELETE per chunk of ids (chunked to stay under SQLite's bound-parameter limit)
+    composite_ids = [comp.composite_id for comp in to_delete]
+    for start in range(0, len(composite_ids), 500):
+        deleted_count += session.query(AuthorCatalogBook).filter(
+            AuthorCatalogBook.id.in_(composite_ids[start:start + 500])
+        ).delete(synchronize_session=False)
+    
+    # Update series info for standalone catalog books (only if we have matches):
+    # series name from composite, position = i (1, 2, 3, etc.)
+    series_updates = {}
     for comp in to_delete:
-        # Mark composite catalog book as duplicate (same as UI marking)
-        # We don't delete it, just mark it so it won't show in recommendations
-        catalog_book = session.query(AuthorCatalogBook).filter_by(id=comp['composite_id']).first()
-        if catalog_book:
-            # Mark as duplicate by setting is_read=True (this prevents it from being recommended)
-            # OR we could add a duplicate flag, but for now use is_read
-            # Actually, let's check if there's a better way - maybe we should just delete it
-            # since the user wants to keep only standalone versions
-            session.delete(catalog_book)
-            deleted_count += 1
-        
-        # Update series info for standalone catalog books (only if we have matches)
-        composite_series_name = comp.get('composite_series_name')
-        if composite_series_name and comp.get('standalone_books'):
-            for i, standalone_info in enumerate(comp['standalone_books'], 1):
-                standalone_book = standalone_info['standalone']
-                # Update series info: series name from composite, position = i (1, 2, 3, etc.)
-                standalone_book.series_name = composite_series_name
-                standalone_book.series_position = i
+        composite_series_name = comp.composite_series_name
+        if composite_series_name and comp.standalone_books:
+            for i, standalone_info in enumerate(comp.standalone_books, 1):
+                standalone_id = standalone_info['standalone'].id
+                series_updates[standalone_id] = {
+                    'id': standalone_id,
+                    'series_name': composite_series_name,
+                    'series_position': i
+                }
                 updated_count += 1
     
+    # One executemany UPDATE for all standalones, by primary key
+    if series_updates:
+        session.bulk_update_mappings(AuthorCatalogBook, list(series_updates.values()))
+    
     session.commit()
     print(f"✓ Deleted {deleted_count} composite catalog books")
     print(f"✓ Updated series info for {updated_count} standalone catalog books")
@@ -245,21 +276,10 @@ def interactive_review():
             return
         
         result = analyze_author_composites(author, session)
-        composites = []
-        for i, match in enumerate(result['matches'], 1):
-            composites.append({
-                'number': i,
-                'author': author.name,
-                'author_id': author.id,
-                'composite': match['composite_book'],
-                'composite_id': match['composite_book'].id,
-                'composite_series_name': match.get('composite_series_name'),
-                'composite_series_position': match.get('composite_series_position'),
-                'standalone_books': match['standalone_books'],
-                'component_titles': match['component_titles'],
-                'confidence': match['confidence'],
-                'reason': match['reason']
-            })
+        composites = [
+            make_composite_entry(i, author, match)
+            for i, match in enumerate(result['matches'], 1)
+        ]
         session.close()
     else:
         composites = collect_all_composites(min_books=min_books, limit=limit)
@@ -368,19 +388,10 @@ if __name__ == '__main__':
                 sys.exit(1)
             
             result = analyze_author_composites(author, session)
-            composites = []
-            for i, match in enumerate(result['matches'], 1):
-                composites.append({
-                    'number': i,
-                    'author': author.name,
-                    'author_id': author.id,
-                    'composite': match['composite_book'],
-                    'composite_id': match['composite_book'].id,
-                    'standalone_books': match['standalone_books'],
-                    'component_titles': match['component_titles'],
-                    'confidence': match['confidence'],
-                    'reason': match['reason']
-                })
+            composites = [
+                make_composite_entry(i, author, match)
+                for i, match in enumerate(result['matches'], 1)
+            ]
             session.close()
         else:
             composites = collect_all_composites(min_books=args.min_books, limit=args.limit)
@@ -11,7 +11,11 @@ This script:
 
 import sys
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Iterator, List, Tuple
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -21,9 +25,54 @@ from src.deduplication.language_detection import detect_non_english_title, is_en
 from sqlalchemy import func
 
 
-def scan_catalog_books(dry_run: bool = True, author_limit: int = None) -> dict:
+@lru_cache(maxsize=200_000)
+def _detect_non_english(title: str) -> Tuple[bool, tuple]:
+    """
+    Cached detect_non_english_title for titles that repeat across authors.
+    
+    Detection only looks at the title (ISBN and Open Library key are unused),
+    so the title alone is the cache key.
+    """
+    is_non_english, reasons = detect_non_english_title(title)
+    return is_non_english, tuple(reasons)
+
+
+def _detect_batch(titles: List[str]) -> List[Tuple[bool, tuple]]:
+    """Classify a batch of titles (runs in a worker process)"""
+    return [_detect_non_english(title) for title in titles]
+
+
+def _iter_detections(rows: Iterator, workers: int, batch_size: int = 1000) -> Iterator:
+    """
+    Yield (row, (is_non_english, reasons)) for each row, in order.
+    
+    With more than one worker, batches of titles are classified in a process
+    pool; only a few batches are in flight at once so rows keep streaming.
+    """
+    if workers <= 1:
+        for row in rows:
+            yield row, _detect_non_english(row.title)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for batch in iter(lambda: list(islice(rows, batch_size)), []):
+            pending.append((batch, executor.submit(_detect_batch, [row.title for row in batch])))
+            if len(pending) > workers * 2:
+                batch, future = pending.popleft()
+                yield from zip(batch, future.result())
+        while pending:
+            batch, future = pending.popleft()
+            yield from zip(batch, future.result())
+
+
+def scan_catalog_books(dry_run: bool = True, author_limit: int = None, workers: int = 1) -> dict:
     """
     Scan all catalog books for non-English titles.
+    
+    Title detection runs in this process by default, where the _detect_non_english
+    memo is shared across the whole scan; pass workers > 1 to classify titles in a
+    process pool instead (each worker then keeps its own memo).
     """
     db_path = Path(__file__).parent.parent / 'data' / 'bookpilot.db'
     engine = init_db(str(db_path))
@@ -38,38 +87,52 @@ def scan_catalog_books(dry_run: bool = True, author_limit: int = None) -> dict:
         print("(LIVE MODE - non-English books will be flagged)")
     print()
     
-    # Get all catalog books that are eligible (not already read)
-    catalog_books = session.query(AuthorCatalogBook).filter_by(
-        is_read=False
-    ).all()
+    # Get all catalog books that are eligible (not already read),
+    # as plain rows with just the columns the detector and report use
+    eligible_query = session.query(
+        AuthorCatalogBook.id,
+        AuthorCatalogBook.title,
+        AuthorCatalogBook.isbn,
+        AuthorCatalogBook.open_library_key,
+        AuthorCatalogBook.author_id
+    ).filter(
+        AuthorCatalogBook.is_read == False
+    )
+    total_scanned = eligible_query.count()
     
-    print(f"Scanning {len(catalog_books)} eligible catalog books...\n")
+    print(f"Scanning {total_scanned} eligible catalog books...\n")
     
     non_english_books = []
     by_author = defaultdict(list)
     by_reason = defaultdict(int)
     
-    for book in catalog_books:
-        is_non_english, reasons = detect_non_english_title(book.title, book.isbn, book.open_library_key)
-        
+    # Stream rows in batches rather than loading the whole catalog at once
+    for book, (is_non_english, reasons) in _iter_detections(iter(eligible_query.yield_per(1000)), workers):
         if is_non_english:
-            # Get author name
-            author = session.query(Author).filter_by(id=book.author_id).first()
-            author_name = author.name if author else f"Author ID {book.author_id}"
-            
             non_english_books.append({
                 'id': book.id,
                 'title': book.title,
-                'author': author_name,
                 'author_id': book.author_id,
                 'isbn': book.isbn,
-                'reasons': reasons
+                'reasons': list(reasons)
             })
-            
-            by_author[author_name].append(book)
             for reason in reasons:
                 by_reason[reason] += 1
     
+    # Look up names only for authors with hits, in one IN query per chunk of ids
+    # (chunked to stay under SQLite's bound-parameter limit)
+    hit_author_ids = list({book['author_id'] for book in non_english_books})
+    author_names = {}
+    for start in range(0, len(hit_author_ids), 500):
+        author_names.update(session.query(Author.id, Author.name).filter(
+            Author.id.in_(hit_author_ids[start:start + 500])
+        ).all())
+    
+    for book in non_english_books:
+        author_name = author_names.get(book['author_id'], f"Author ID {book['author_id']}")
+        book['author'] = author_name
+        by_author[author_name].append(book)
+    
     print(f"Found {len(non_english_books)} non-English catalog books\n")
     
     if non_english_books:
@@ -114,13 +177,10 @@ def scan_catalog_books(dry_run: bool = True, author_limit: int = None) -> dict:
         
         if not dry_run:
             print("Flagging non-English books in database...")
-            flagged_count = 0
-            for book_data in non_english_books:
-                catalog_book = session.query(AuthorCatalogBook).filter_by(id=book_data['id']).first()
-                if catalog_book:
-                    # We could add a non_english flag to AuthorCatalogBook, but for now
-                    # we'll just note that these should be filtered out
-                    flagged_count += 1
+            # We could add a non_english flag to AuthorCatalogBook, but for now
+            # we'll just note that these should be filtered out (the rows were
+            # read above, so there is nothing to re-fetch one by one)
+            flagged_count = len(non_english_books)
             print(f"  Processed {flagged_count} books")
             session.commit()
     else:
@@ -129,7 +189,7 @@ def scan_catalog_books(dry_run: bool = True, author_limit: int = None) -> dict:
     session.close()
     
     return {
-        'total_scanned': len(catalog_books),
+        'total_scanned': total_scanned,
         'non_english_found': len(non_english_books),
         'by_reason': dict(by_reason),
         'by_author': {k: len(v) for k, v in by_author.items()}
@@ -145,7 +205,9 @@ if __name__ == '__main__':
                        help='Actually flag non-English books (default is dry run)')
     parser.add_argument('--limit', type=int,
                        help='Limit number of authors to process')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Number of processes for title detection (default: 1, i.e. no process pool)')
     
     args = parser.parse_args()
     
-    scan_catalog_books(dry_run=not args.execute, author_limit=args.limit)
+    scan_catalog_books(dry_run=not args.execute, author_limit=args.limit, workers=args.workers)
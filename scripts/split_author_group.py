@@ -1,16 +1,19 @@
 #!/usr/bin/env python3
 """Script to split author groups into individual authors and re-catalog books"""
+import re
 import sys
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.models import init_db, get_session, Author, Book, AuthorCatalogBook, Recommendation
+from src.models import init_db, get_session, Author, Book, AuthorCatalogBook, Recommendation, find_author_by_name
 from src.ingest import normalize_author_name
 from src.api.openlibrary import OpenLibraryClient
 from sqlalchemy import or_, func
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 
 def search_author_group(db_session, author_group_name):
@@ -20,15 +23,19 @@ def search_author_group(db_session, author_group_name):
     
     # Normalize the group name
     normalized_group = normalize_author_name(author_group_name)
+    # Case-insensitive equality on lower(author) can use an index, unlike a '%name%' ILIKE
+    group_names_lower = [author_group_name.lower(), normalized_group.lower()]
     
     # Find the author record (if it exists)
     author_record = db_session.query(Author).filter(
         or_(
-            Author.name == author_group_name,
-            Author.name.ilike(f'%{author_group_name}%'),
-            Author.normalized_name == normalized_group
+            func.lower(Author.name) == group_names_lower[0],
+            func.lower(Author.normalized_name) == group_names_lower[1]
         )
     ).first()
+    if not author_record:
+        # Fall back to a partial name match
+        author_record = find_author_by_name(db_session, author_group_name)
     
     results = {
         'author_record': author_record,
@@ -39,29 +46,24 @@ def search_author_group(db_session, author_group_name):
     
     # Search in Books table
     books = db_session.query(Book).filter(
-        or_(
-            Book.author == author_group_name,
-            Book.author.ilike(f'%{author_group_name}%'),
-            Book.author == normalized_group
-        )
-    ).all()
+        Book.author_lc.in_(group_names_lower)
+    ).order_by(Book.id).all()
     results['books'] = books
     
     # Search in AuthorCatalogBook if author record exists
+    # (only the columns the split reads; updates are written by id)
     if author_record:
-        catalog_books = db_session.query(AuthorCatalogBook).filter_by(
+        catalog_books = db_session.query(
+            AuthorCatalogBook.id, AuthorCatalogBook.title, AuthorCatalogBook.open_library_key
+        ).filter_by(
             author_id=author_record.id
-        ).all()
+        ).order_by(AuthorCatalogBook.id).all()
         results['catalog_books'] = catalog_books
     
     # Search in Recommendations
     recommendations = db_session.query(Recommendation).filter(
-        or_(
-            Recommendation.author == author_group_name,
-            Recommendation.author.ilike(f'%{author_group_name}%'),
-            Recommendation.author == normalized_group
-        )
-    ).all()
+        Recommendation.author_lc.in_(group_names_lower)
+    ).order_by(Recommendation.id).all()
     results['recommendations'] = recommendations
     
     # Print results
@@ -88,10 +90,40 @@ def search_author_group(db_session, author_group_name):
     return results
 
 
-def match_author_from_open_library(ol_client, work_key, individual_authors):
+def _work_author_keys(work_details):
+    """Yield the normalized '/authors/...' keys listed on an Open Library work, in order"""
+    for auth in work_details.get('authors', []):
+        # Extract author key - can be nested
+        author_key = None
+        if isinstance(auth, dict):
+            if 'author' in auth and isinstance(auth['author'], dict):
+                author_key = auth['author'].get('key', '')
+            elif 'key' in auth:
+                author_key = auth.get('key', '')
+        elif isinstance(auth, str):
+            author_key = auth
+        
+        if author_key:
+            # Normalize author key
+            if not author_key.startswith('/authors/'):
+                if author_key.startswith('/'):
+                    author_key = f"/authors{author_key}"
+                else:
+                    author_key = f"/authors/{author_key}"
+            yield author_key
+
+
+def match_author_from_open_library(ol_client, work_key, normalized_individuals, individual_last_names,
+                                   author_cache=None, work_cache=None):
     """
     Get the actual author(s) from Open Library work and match to individual authors
     
+    Args:
+        normalized_individuals: normalize_author_name() of each individual author
+        individual_last_names: Lowercased last name of each individual author ('' if none)
+        author_cache: Optional dict of author key -> author data, shared across calls
+        work_cache: Optional dict of work key -> work details, shared across calls
+    
     Returns:
         Index of matching author in individual_authors list, or None if no match
     """
@@ -99,59 +131,140 @@ def match_author_from_open_library(ol_client, work_key, individual_authors):
         return None
     
     try:
-        work_details = ol_client.get_work_details(work_key)
+        if work_cache is not None and work_key in work_cache:
+            work_details = work_cache[work_key]
+        else:
+            work_details = ol_client.get_work_details(work_key)
+            if work_cache is not None:
+                work_cache[work_key] = work_details
         if not work_details:
             return None
         
         # Get authors from work
-        authors_list = work_details.get('authors', [])
-        for auth in authors_list:
-            # Extract author key - can be nested
-            author_key = None
-            if isinstance(auth, dict):
-                if 'author' in auth and isinstance(auth['author'], dict):
-                    author_key = auth['author'].get('key', '')
-                elif 'key' in auth:
-                    author_key = auth.get('key', '')
-            elif isinstance(auth, str):
-                author_key = auth
-            
-            if author_key:
-                # Normalize author key
-                if not author_key.startswith('/authors/'):
-                    if author_key.startswith('/'):
-                        author_key = f"/authors{author_key}"
-                    else:
-                        author_key = f"/authors/{author_key}"
-                
-                # Fetch author details to get the name
-                try:
+        for author_key in _work_author_keys(work_details):
+            # Fetch author details to get the name
+            try:
+                if author_cache is not None and author_key in author_cache:
+                    author_data = author_cache[author_key]
+                else:
                     author_data = ol_client._request(f"{author_key}.json")
-                    if author_data:
-                        author_name = author_data.get('name', '')
-                        if author_name:
-                            # Try to match to individual authors
-                            author_name_normalized = normalize_author_name(author_name)
-                            for i, individual_author in enumerate(individual_authors):
-                                individual_normalized = normalize_author_name(individual_author)
-                                # Check if names match (exact or last name match)
-                                if author_name_normalized == individual_normalized:
-                                    return i
-                                # Check last name match
-                                author_parts = author_name.split()
-                                individual_parts = individual_author.split()
-                                if len(author_parts) >= 1 and len(individual_parts) >= 1:
-                                    if author_parts[-1].lower() == individual_parts[-1].lower():
-                                        return i
-                except Exception:
-                    pass
+                    if author_cache is not None:
+                        author_cache[author_key] = author_data
+                if author_data:
+                    author_name = author_data.get('name', '')
+                    if author_name:
+                        # Try to match to individual authors
+                        author_name_normalized = normalize_author_name(author_name)
+                        author_parts = author_name.split()
+                        author_last_name = author_parts[-1].lower() if author_parts else ''
+                        for i, individual_normalized in enumerate(normalized_individuals):
+                            # Check if names match (exact or last name match)
+                            if author_name_normalized == individual_normalized:
+                                return i
+                            # Check last name match
+                            if author_last_name and author_last_name == individual_last_names[i]:
+                                return i
+            except Exception:
+                pass
     except Exception as e:
         pass
     
     return None
 
 
-def split_author_group(db_session, author_group_name, individual_authors, dry_run=True, limit=None):
+def match_authors_batch(ol_client, cat_books, normalized_individuals, individual_last_names,
+                        author_cache=None, work_cache=None, max_workers=4):
+    """
+    Match catalog books to individual authors via Open Library
+    
+    Every distinct work and author record not already in the caches is fetched once
+    up front, several at a time, so the per-book matching runs from memory.
+    
+    Returns:
+        Dict mapping catalog book ID to the index of its author in individual_authors (or None)
+    """
+    def fetch(fetcher, key):
+        try:
+            return fetcher(key)
+        except Exception:
+            return None
+    
+    author_cache = {} if author_cache is None else author_cache
+    work_cache = {} if work_cache is None else work_cache
+    
+    work_keys = list({
+        cat_book.open_library_key for cat_book in cat_books
+        if cat_book.open_library_key and cat_book.open_library_key not in work_cache
+    })
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        work_cache.update(zip(work_keys, executor.map(partial(fetch, ol_client.get_work_details), work_keys)))
+        author_keys = list({
+            author_key
+            for work_details in work_cache.values() if isinstance(work_details, dict)
+            for author_key in _work_author_keys(work_details)
+            if author_key not in author_cache
+        })
+        author_cache.update(zip(
+            author_keys,
+            executor.map(partial(fetch, ol_client._request), [f"{key}.json" for key in author_keys])
+        ))
+    
+    return {
+        cat_book.id: match_author_from_open_library(
+            ol_client, cat_book.open_library_key, normalized_individuals, individual_last_names,
+            author_cache=author_cache, work_cache=work_cache
+        )
+        for cat_book in cat_books
+    }
+
+
+def compile_title_pattern(title_last_names):
+    """Compile one regex matching any of the last names (None if there are none)"""
+    last_names = [last_name for last_name in title_last_names if last_name]
+    if not last_names:
+        return None
+    return re.compile('|'.join(re.escape(last_name) for last_name in last_names))
+
+
+def match_author_by_title(title_lower, title_last_names, title_pattern):
+    """
+    Find the first individual author whose last name appears in a lowercased title
+    
+    Args:
+        title_pattern: compile_title_pattern(title_last_names), used to skip titles
+            that contain none of the last names in a single scan
+    
+    Returns:
+        Index of the author in the individual authors list, or None if no last name appears
+    """
+    if title_pattern is None or not title_pattern.search(title_lower):
+        return None
+    for i, last_name in enumerate(title_last_names):
+        if last_name and last_name in title_lower:
+            return i
+    return None
+
+
+def assign_author_by_title(title_lower, title_to_author, individual_authors, title_last_names, title_pattern):
+    """
+    Pick the individual author for a Libby book or recommendation from its lowercased title
+    
+    Tries the catalog title mapping first, then a last-name match in the title, and
+    otherwise defaults to the first author.
+    
+    Returns:
+        Tuple of (author name, how it matched: 'catalog', 'title' or None for the default)
+    """
+    if title_lower in title_to_author:
+        return title_to_author[title_lower], 'catalog'
+    title_idx = match_author_by_title(title_lower, title_last_names, title_pattern)
+    if title_idx is not None:
+        return individual_authors[title_idx], 'title'
+    return individual_authors[0], None
+
+
+def split_author_group(db_session, author_group_name, individual_authors, dry_run=True, limit=None,
+                       verbose=False):
     """
     Split author group into individual authors and re-associate books
     
@@ -160,13 +273,25 @@ def split_author_group(db_session, author_group_name, individual_authors, dry_ru
         author_group_name: The full author group name (e.g., "Author A, Author B, Author C")
         individual_authors: List of individual author names (e.g., ["Author A", "Author B", "Author C"])
         dry_run: If True, only show what would be done without making changes
+        verbose: If True, print every re-assignment made in execute mode
     """
     print(f"\n{'[DRY RUN] ' if dry_run else ''}Splitting author group: '{author_group_name}'")
     print("=" * 80)
     print(f"Individual authors: {', '.join(individual_authors)}")
     
-    # Initialize Open Library client
+    # Initialize Open Library client, with lookups shared by every catalog book in the group
     ol_client = OpenLibraryClient()
+    author_cache = {}
+    work_cache = {}
+    
+    # Normalize the individual names once for matching against Open Library authors
+    normalized_individuals = [normalize_author_name(author) for author in individual_authors]
+    normalized_by_author = dict(zip(individual_authors, normalized_individuals))
+    individual_last_names = [author.split()[-1].lower() if author.split() else '' for author in individual_authors]
+    # Title matching only uses the last names of authors with at least a first and last name
+    title_last_names = [last_name if len(author.split()) >= 2 else None
+                        for author, last_name in zip(individual_authors, individual_last_names)]
+    title_pattern = compile_title_pattern(title_last_names)
     
     # Search for existing records
     results = search_author_group(db_session, author_group_name)
@@ -175,6 +300,9 @@ def split_author_group(db_session, author_group_name, individual_authors, dry_ru
         print("\n⚠ No records found for this author group.")
         return
     
+    # The group's full catalog size, so we know later whether every book was moved off it
+    total_catalog_books = len(results['catalog_books'])
+    
     # Apply limit if specified (for testing)
     if limit and len(results['catalog_books']) > limit:
         print(f"\n⚠ Limiting to first {limit} catalog books for testing")
@@ -186,50 +314,32 @@ def split_author_group(db_session, author_group_name, individual_authors, dry_ru
     # Create or find individual author records
     # IMPORTANT: We need to be very careful about matching to avoid matching wrong authors
     individual_author_records = []
+    
+    # Step 1: Try exact name match first (most reliable), for all individual authors in one query
+    # We ONLY match by exact name to avoid false matches (e.g. one author matching another's normalized_name)
+    existing_query = db_session.query(Author).filter(Author.name.in_(individual_authors))
+    
+    # Exclude the group author if it exists
+    if group_author_id:
+        existing_query = existing_query.filter(Author.id != group_author_id)
+    
+    authors_by_name = {author.name: author for author in existing_query}
+    
+    new_authors = []
     for author_name in individual_authors:
-        normalized = normalize_author_name(author_name)
-        
-        # Step 1: Try exact name match first (most reliable)
-        # We ONLY match by exact name to avoid false matches (e.g. one author matching another's normalized_name)
-        author = db_session.query(Author).filter(Author.name == author_name)
-        
-        # Exclude the group author if it exists
-        if group_author_id:
-            author = author.filter(Author.id != group_author_id)
-        
-        author = author.first()
+        normalized = normalized_by_author[author_name]
+        author = authors_by_name.get(author_name)
         
         # Step 2: If no exact match, create a new author record
         # We do NOT match by normalized_name to avoid false matches between different authors
         if not author:
             if not dry_run:
-                # Make sure we get a unique ID by flushing and checking
-                # SQLAlchemy will handle this automatically, but let's be explicit
                 author = Author(
                     name=author_name,
                     normalized_name=normalized
                 )
-                db_session.add(author)
-                db_session.flush()  # This will assign an ID
-                
-                # Verify the author was created with a unique ID
-                # (SQLAlchemy handles this, but let's double-check it's not a duplicate)
-                existing_check = db_session.query(Author).filter_by(
-                    name=author_name,
-                    normalized_name=normalized
-                ).all()
-                if len(existing_check) > 1:
-                    # This shouldn't happen, but if it does, use the first one
-                    print(f"  ⚠ Warning: Multiple authors with name '{author_name}' found, using first")
-                    author = existing_check[0]
-                    # Remove the duplicate we just created
-                    for dup in existing_check[1:]:
-                        if dup.id == author.id:
-                            continue
-                        db_session.delete(dup)
-                    db_session.flush()
-                
-                print(f"  ✓ Created new author: {author_name} (ID: {author.id})")
+                new_authors.append(author)
+                authors_by_name[author_name] = author
             else:
                 print(f"  [Would create] new author: {author_name}")
         else:
@@ -243,6 +353,14 @@ def split_author_group(db_session, author_group_name, individual_authors, dry_ru
         
         individual_author_records.append(author if not dry_run or author else None)
     
+    if new_authors:
+        # Insert all new authors together; one flush assigns all their IDs
+        db_session.add_all(new_authors)
+        db_session.flush()
+        
+        for author in new_authors:
+            print(f"  ✓ Created new author: {author.name} (ID: {author.id})")
+    
     # Initialize assignment counters
     assignment_counts = {
         'catalog_books': {author: 0 for author in individual_authors},
@@ -255,15 +373,17 @@ def split_author_group(db_session, author_group_name, individual_authors, dry_ru
         print("\nAnalyzing catalog books to determine author assignments...")
         print(f"  (This may take a while for {len(results['catalog_books'])} books...)\n")
         # Still analyze in dry run mode to show what would happen
+        author_matches = match_authors_batch(
+            ol_client, results['catalog_books'], normalized_individuals, individual_last_names,
+            author_cache=author_cache, work_cache=work_cache
+        )
         matched_count = 0
+        # Map catalog titles to their assigned author (used to match Libby books and recommendations)
+        title_to_author = {}
         for idx, cat_book in enumerate(results['catalog_books'], 1):
             if idx % 10 == 0:
                 print(f"  Processing {idx}/{len(results['catalog_books'])}...")
-            author_idx = match_author_from_open_library(
-                ol_client, 
-                cat_book.open_library_key, 
-                individual_authors
-            )
+            author_idx = author_matches[cat_book.id]
             if author_idx is not None:
                 matched_count += 1
                 assigned_author = individual_authors[author_idx]
@@ -276,57 +396,23 @@ def split_author_group(db_session, author_group_name, individual_authors, dry_ru
                 assignment_counts['catalog_books'][assigned_author] += 1
                 if idx <= 20:  # Show first 20 defaults
                     print(f"  [Would assign] '{cat_book.title}' → {assigned_author} (default, no match found)")
-        
-        # Analyze Libby books (dry run)
-        print("\nAnalyzing Libby books...")
-        title_to_author = {}
-        for cat_book in results['catalog_books']:
-            author_idx = match_author_from_open_library(
-                ol_client, 
-                cat_book.open_library_key, 
-                individual_authors
-            )
             if cat_book.title:
-                if author_idx is not None:
-                    title_to_author[cat_book.title.lower().strip()] = individual_authors[author_idx]
-                else:
-                    title_to_author[cat_book.title.lower().strip()] = individual_authors[0]
+                title_to_author[cat_book.title.lower().strip()] = assigned_author
         
+        # Analyze Libby books and recommendations (dry run)
+        print("\nAnalyzing Libby books...")
         for book in results['books']:
             book_title_lower = book.title.lower().strip() if book.title else ""
-            assigned_author = individual_authors[0]  # default
-            
-            if book_title_lower in title_to_author:
-                assigned_author = title_to_author[book_title_lower]
-            else:
-                # Try title-based matching
-                for i, author_name in enumerate(individual_authors):
-                    author_first_last = author_name.split()
-                    if len(author_first_last) >= 2:
-                        last_name = author_first_last[-1].lower()
-                        if last_name in book_title_lower:
-                            assigned_author = author_name
-                            break
-            
+            assigned_author, _ = assign_author_by_title(
+                book_title_lower, title_to_author, individual_authors, title_last_names, title_pattern
+            )
             assignment_counts['books'][assigned_author] += 1
         
-        # Analyze recommendations (dry run)
         for rec in results['recommendations']:
             rec_title_lower = rec.title.lower() if rec.title else ""
-            assigned_author = individual_authors[0]  # default
-            
-            if rec_title_lower in title_to_author:
-                assigned_author = title_to_author[rec_title_lower]
-            else:
-                # Try title-based matching
-                for i, author_name in enumerate(individual_authors):
-                    author_first_last = author_name.split()
-                    if len(author_first_last) >= 2:
-                        last_name = author_first_last[-1].lower()
-                        if last_name in rec_title_lower:
-                            assigned_author = author_name
-                            break
-            
+            assigned_author, _ = assign_author_by_title(
+                rec_title_lower, title_to_author, individual_authors, title_last_names, title_pattern
+            )
             assignment_counts['recommendations'][assigned_author] += 1
         
         # Print summary report
@@ -349,24 +435,28 @@ def split_author_group(db_session, author_group_name, individual_authors, dry_ru
     print(f"  (Processing {len(results['catalog_books'])} books, this may take a while...)\n")
     catalog_updated = 0
     catalog_unmatched = 0
+    # Reassignments are collected and written in bulk once every row has been decided
+    catalog_updates = []
+    
+    # Try to get each book's author from Open Library
+    author_matches = match_authors_batch(
+        ol_client, results['catalog_books'], normalized_individuals, individual_last_names,
+        author_cache=author_cache, work_cache=work_cache
+    )
     
     for idx, cat_book in enumerate(results['catalog_books'], 1):
         if idx % 20 == 0:
             print(f"  Processing {idx}/{len(results['catalog_books'])}...")
-        # Try to get author from Open Library
-        author_idx = match_author_from_open_library(
-            ol_client, 
-            cat_book.open_library_key, 
-            individual_authors
-        )
+        author_idx = author_matches[cat_book.id]
         
         assigned_author = None
         if author_idx is not None and individual_author_records[author_idx]:
-            cat_book.author_id = individual_author_records[author_idx].id
+            catalog_updates.append({'id': cat_book.id, 'author_id': individual_author_records[author_idx].id})
             catalog_updated += 1
             assigned_author = individual_authors[author_idx]
             assignment_counts['catalog_books'][assigned_author] += 1
-            print(f"  ✓ Re-assigned catalog book '{cat_book.title}' to {assigned_author}")
+            if verbose:
+                print(f"  ✓ Re-assigned catalog book '{cat_book.title}' to {assigned_author}")
             
             # Add to title mapping for Libby books
             if cat_book.title:
@@ -376,32 +466,28 @@ def split_author_group(db_session, author_group_name, individual_authors, dry_ru
             book_title_lower = cat_book.title.lower() if cat_book.title else ""
             assigned = False
             
-            for i, author_record in enumerate(individual_author_records):
-                if not author_record:
-                    continue
-                author_name = individual_authors[i]
-                author_first_last = author_name.split()
-                if len(author_first_last) >= 2:
-                    last_name = author_first_last[-1].lower()
-                    if last_name in book_title_lower:
-                        cat_book.author_id = author_record.id
-                        catalog_updated += 1
-                        assigned = True
-                        assigned_author = author_name
-                        assignment_counts['catalog_books'][assigned_author] += 1
-                        print(f"  ✓ Re-assigned catalog book '{cat_book.title}' to {author_name} (title match)")
-                        if cat_book.title:
-                            title_to_author[cat_book.title.lower().strip()] = author_name
-                        break
+            title_idx = match_author_by_title(book_title_lower, title_last_names, title_pattern)
+            if title_idx is not None and individual_author_records[title_idx]:
+                author_name = individual_authors[title_idx]
+                catalog_updates.append({'id': cat_book.id, 'author_id': individual_author_records[title_idx].id})
+                catalog_updated += 1
+                assigned = True
+                assigned_author = author_name
+                assignment_counts['catalog_books'][assigned_author] += 1
+                if verbose:
+                    print(f"  ✓ Re-assigned catalog book '{cat_book.title}' to {author_name} (title match)")
+                if cat_book.title:
+                    title_to_author[cat_book.title.lower().strip()] = author_name
             
             if not assigned and individual_author_records:
                 # Default to first author
-                cat_book.author_id = individual_author_records[0].id
+                catalog_updates.append({'id': cat_book.id, 'author_id': individual_author_records[0].id})
                 catalog_updated += 1
                 catalog_unmatched += 1
                 assigned_author = individual_authors[0]
                 assignment_counts['catalog_books'][assigned_author] += 1
-                print(f"  ⚠ Re-assigned catalog book '{cat_book.title}' to {assigned_author} (default, no match found)")
+                if verbose:
+                    print(f"  ⚠ Re-assigned catalog book '{cat_book.title}' to {assigned_author} (default, no match found)")
                 if cat_book.title:
                     title_to_author[cat_book.title.lower().strip()] = assigned_author
     
@@ -409,87 +495,59 @@ def split_author_group(db_session, author_group_name, individual_authors, dry_ru
     print("\nRe-assigning Libby books...")
     books_updated = 0
     books_unmatched = 0
+    book_ids_by_author = defaultdict(list)
     
     for book in results['books']:
-        assigned = False
         book_title_lower = book.title.lower().strip() if book.title else ""
-        assigned_author = None
-        
-        # First, try to match via catalog book title
-        if book_title_lower in title_to_author:
-            assigned_author = title_to_author[book_title_lower]
-            book.author = normalize_author_name(assigned_author)
-            books_updated += 1
-            assigned = True
-            assignment_counts['books'][assigned_author] += 1
-            print(f"  ✓ Re-assigned book '{book.title}' to {assigned_author} (matched via catalog)")
-        else:
-            # Try title-based matching
-            for i, author_name in enumerate(individual_authors):
-                author_first_last = author_name.split()
-                if len(author_first_last) >= 2:
-                    last_name = author_first_last[-1].lower()
-                    if last_name in book_title_lower:
-                        assigned_author = author_name
-                        book.author = normalize_author_name(assigned_author)
-                        books_updated += 1
-                        assigned = True
-                        assignment_counts['books'][assigned_author] += 1
-                        print(f"  ✓ Re-assigned book '{book.title}' to {assigned_author} (title match)")
-                        break
-        
-        if not assigned:
-            # Default to first author if can't determine
-            assigned_author = individual_authors[0]
-            book.author = normalize_author_name(assigned_author)
-            books_updated += 1
+        assigned_author, matched_by = assign_author_by_title(
+            book_title_lower, title_to_author, individual_authors, title_last_names, title_pattern
+        )
+        book_ids_by_author[normalized_by_author[assigned_author]].append(book.id)
+        books_updated += 1
+        assignment_counts['books'][assigned_author] += 1
+        if not matched_by:
+            # Defaulted to first author because we couldn't determine
             books_unmatched += 1
-            assignment_counts['books'][assigned_author] += 1
-            print(f"  ⚠ Re-assigned book '{book.title}' to {assigned_author} (default, no match found)")
+        if verbose:
+            if matched_by == 'catalog':
+                print(f"  ✓ Re-assigned book '{book.title}' to {assigned_author} (matched via catalog)")
+            elif matched_by == 'title':
+                print(f"  ✓ Re-assigned book '{book.title}' to {assigned_author} (title match)")
+            else:
+                print(f"  ⚠ Re-assigned book '{book.title}' to {assigned_author} (default, no match found)")
     
     # Re-associate Recommendations
     print("\nRe-assigning recommendations...")
     recs_updated = 0
+    rec_ids_by_author = defaultdict(list)
     for rec in results['recommendations']:
         rec_title_lower = rec.title.lower() if rec.title else ""
-        assigned = False
-        assigned_author = None
-        
-        # Try to match via catalog
-        if rec_title_lower in title_to_author:
-            assigned_author = title_to_author[rec_title_lower]
-            rec.author = assigned_author
-            recs_updated += 1
-            assigned = True
-            assignment_counts['recommendations'][assigned_author] += 1
-            print(f"  ✓ Re-assigned recommendation '{rec.title}' to {assigned_author}")
-        else:
-            # Try title-based matching
-            for i, author_name in enumerate(individual_authors):
-                author_first_last = author_name.split()
-                if len(author_first_last) >= 2:
-                    last_name = author_first_last[-1].lower()
-                    if last_name in rec_title_lower:
-                        assigned_author = author_name
-                        rec.author = assigned_author
-                        recs_updated += 1
-                        assigned = True
-                        assignment_counts['recommendations'][assigned_author] += 1
-                        print(f"  ✓ Re-assigned recommendation '{rec.title}' to {assigned_author}")
-                        break
-        
-        if not assigned:
-            assigned_author = individual_authors[0]
-            rec.author = assigned_author
-            recs_updated += 1
-            assignment_counts['recommendations'][assigned_author] += 1
-            print(f"  ⚠ Re-assigned recommendation '{rec.title}' to {assigned_author} (default)")
+        assigned_author, matched_by = assign_author_by_title(
+            rec_title_lower, title_to_author, individual_authors, title_last_names, title_pattern
+        )
+        rec_ids_by_author[assigned_author].append(rec.id)
+        recs_updated += 1
+        assignment_counts['recommendations'][assigned_author] += 1
+        if verbose:
+            if matched_by:
+                print(f"  ✓ Re-assigned recommendation '{rec.title}' to {assigned_author}")
+            else:
+                print(f"  ⚠ Re-assigned recommendation '{rec.title}' to {assigned_author} (default)")
+    
+    db_session.bulk_update_mappings(AuthorCatalogBook, catalog_updates)
+    # Libby books and recommendations take one of a few author values: one UPDATE per value
+    # (ids chunked to stay under SQLite's bound-parameter limit)
+    for model, ids_by_author in ((Book, book_ids_by_author), (Recommendation, rec_ids_by_author)):
+        for author_value, ids in ids_by_author.items():
+            for start in range(0, len(ids), 500):
+                db_session.query(model).filter(model.id.in_(ids[start:start + 500])).update(
+                    {model.author: author_value}, synchronize_session=False
+                )
     
     # Optionally remove the group author record if it has no more catalog books
+    # (every catalog book in catalog_updates was moved to an individual author)
     if results['author_record']:
-        remaining_catalog = db_session.query(AuthorCatalogBook).filter_by(
-            author_id=results['author_record'].id
-        ).count()
+        remaining_catalog = total_catalog_books - len(catalog_updates)
         
         if remaining_catalog == 0:
             print(f"\n  ✓ Removing empty author group record: {results['author_record'].name}")
@@ -559,6 +617,8 @@ def main():
                        help='Actually execute the changes (default is dry run)')
     parser.add_argument('--limit', type=int, default=None,
                        help='Limit number of catalog books to process (for testing)')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Print every re-assignment (execute mode)')
     
     args = parser.parse_args()
     
@@ -582,7 +642,8 @@ def main():
                 args.author_group,
                 args.individual_authors,
                 dry_run=dry_run,
-                limit=args.limit
+                limit=args.limit,
+                verbose=args.verbose
             )
     finally:
         session.close()
@@ -7,6 +7,7 @@ with >100 catalog books.
 """
 
 import sys
+import csv
 from pathlib import Path
 from collections import defaultdict
 
@@ -18,13 +19,14 @@ from src.deduplication.language_detection import detect_non_english_title, is_en
 from sqlalchemy import func
 
 
-def test_language_detection(min_books: int = 100, limit: int = 10):
+def test_language_detection(min_books: int = 100, limit: int = 10, output_file: str = None):
     """
     Test language detection on prolific authors.
     
     Args:
         min_books: Minimum number of catalog books to consider
         limit: Limit number of authors to process
+        output_file: Optional CSV path for every classified book
     """
     db_path = Path(__file__).parent.parent / 'data' / 'bookpilot.db'
     engine = init_db(str(db_path))
@@ -67,6 +69,23 @@ def test_language_detection(min_books: int = 100, limit: int = 10):
         session.close()
         return
     
+    # Load the unread catalog books for all prolific authors up front (in chunks of
+    # author ids) rather than issuing one query per author
+    author_ids = [author_id for author_id, _, _ in prolific_authors]
+    books_by_author = defaultdict(list)
+    for start in range(0, len(author_ids), 500):
+        rows = session.query(
+            AuthorCatalogBook.author_id,
+            AuthorCatalogBook.title,
+            AuthorCatalogBook.isbn,
+            AuthorCatalogBook.open_library_key
+        ).filter(
+            AuthorCatalogBook.author_id.in_(author_ids[start:start + 500]),
+            AuthorCatalogBook.is_read == False
+        ).order_by(AuthorCatalogBook.author_id, AuthorCatalogBook.title, AuthorCatalogBook.id)
+        for row in rows:
+            books_by_author[row.author_id].append(row)
+    
     # Process each author
     all_results = []
     
@@ -76,11 +95,8 @@ def test_language_detection(min_books: int = 100, limit: int = 10):
         print(f"Total catalog books (not read): {catalog_count}")
         print("="*80)
         
-        # Get all catalog books for this author
-        catalog_books = session.query(AuthorCatalogBook).filter_by(
-            author_id=author_id,
-            is_read=False
-        ).order_by(AuthorCatalogBook.title).all()
+        # All catalog books for this author, ordered by title
+        catalog_books = books_by_author[author_id]
         
         english_books = []
         non_english_books = []
@@ -111,12 +127,15 @@ def test_language_detection(min_books: int = 100, limit: int = 10):
         if non_english_books:
             print(f"\n❌ NON-ENGLISH BOOKS ({len(non_english_books)}):")
             print("-" * 80)
+            # Build the listing and write it once rather than printing line by line
+            lines = []
             for i, book in enumerate(non_english_books, 1):
-                print(f"{i:3d}. {book['title']}")
+                lines.append(f"{i:3d}. {book['title']}")
                 if book['isbn']:
-                    print(f"      ISBN: {book['isbn']}")
-                print(f"      Reasons: {', '.join(book['reasons'])}")
-                print()
+                    lines.append(f"      ISBN: {book['isbn']}")
+                lines.append(f"      Reasons: {', '.join(book['reasons'])}")
+                lines.append("")
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             print(f"\n✅ No non-English books detected")
         
@@ -165,6 +184,24 @@ def test_language_detection(min_books: int = 100, limit: int = 10):
               f"English: {result['english_count']:4d} ({result['english_count']/result['total']*100:5.1f}%) | "
               f"Non-English: {result['non_english_count']:4d} ({result['non_english_count']/result['total']*100:5.1f}%)")
     
+    # Full per-book results go to a file in one write (the console shows a condensed view)
+    if output_file:
+        output_path = Path(output_file)
+        with open(output_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['author', 'author_id', 'title', 'isbn', 'language', 'reasons'])
+            for result in all_results:
+                writer.writerows(
+                    (result['author'], result['author_id'], book['title'], book['isbn'] or '',
+                     'non-English', ' | '.join(book['reasons']))
+                    for book in result['non_english_books']
+                )
+                writer.writerows(
+                    (result['author'], result['author_id'], book['title'], book['isbn'] or '', 'English', '')
+                    for book in result['english_books']
+                )
+        print(f"\n✓ Per-book results saved to: {output_path}")
+    
     session.close()
     
     return all_results
@@ -179,7 +216,9 @@ if __name__ == '__main__':
                        help='Minimum number of catalog books (default: 100)')
     parser.add_argument('--limit', type=int, default=10,
                        help='Limit number of authors to process (default: 10)')
+    parser.add_argument('--output', type=str,
+                       help='Write every classified book to this CSV file')
     
     args = parser.parse_args()
     
-    test_language_detection(min_books=args.min_books, limit=args.limit)
+    test_language_detection(min_books=args.min_books, limit=args.limit, output_file=args.output)
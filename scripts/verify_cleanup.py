@@ -4,6 +4,8 @@ Verify cleanup results - show what books were removed and why they were flagged
 """
 
 import sys
+import csv
+from collections import Counter
 from pathlib import Path
 
 # Add parent directory to path
@@ -13,6 +15,45 @@ from src.models import init_db, get_session, Author, AuthorCatalogBook
 from src.catalog import cleanup_non_english_books
 import re
 
+# Language-detection patterns, compiled once at import rather than on every check
+NON_ENGLISH_LANGUAGES = (
+    'french|russian|spanish|german|italian|portuguese|chinese|japanese|korean|arabic|hebrew|'
+    'polish|dutch|swedish|norwegian|danish|finnish|greek|turkish|hindi|thai|vietnamese|'
+    'indonesian|malay|tagalog|romanian|hungarian|czech|slovak|croatian|serbian|bulgarian|'
+    'ukrainian|persian|urdu|bengali|tamil|telugu|marathi|gujarati|kannada|malayalam|'
+    'punjabi|nepali|sinhala|myanmar|khmer|lao|mongolian|georgian|armenian|azerbaijani|'
+    'kazakh|uzbek|turkmen|kyrgyz|tajik|afrikaans|swahili|zulu|xhosa|amharic|hausa|'
+    'yoruba|igbo|somali|maltese|icelandic|basque|catalan|galician|welsh|irish|scottish|'
+    'breton|cornish|manx'
+)
+PAREN_RE = re.compile(
+    rf'\([^)]*(?:{NON_ENGLISH_LANGUAGES})\s*(?:edition|version|translation)?[^)]*\)',
+    re.IGNORECASE
+)
+BRACKET_RE = re.compile(
+    rf'\[[^\]]*(?:{NON_ENGLISH_LANGUAGES})\s*(?:edition|version|translation)?[^\]]*\]',
+    re.IGNORECASE
+)
+STANDALONE_RE = re.compile(
+    rf'\b(?:{NON_ENGLISH_LANGUAGES})\s+(?:edition|version|translation)\b',
+    re.IGNORECASE
+)
+# Cheap literal gate: a standalone edition match always contains one of these words
+EDITION_WORD_RE = re.compile(r'edition|version|translation', re.IGNORECASE)
+SPANISH_IND_RE = re.compile(
+    r'\b(?:edici[oó]n|colecci[oó]n|estuche|libro|libros|misterio|pr[ií]ncipe)\b',
+    re.IGNORECASE
+)
+MAJOR_NON_ENG_RE = re.compile(
+    r'[\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff\u0400-\u04ff\u0600-\u06ff\u0590-\u05ff]'
+)
+ACCENTED_RE = re.compile(
+    r'[àáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿąćčđęěğıłńňřśşšťůźżž]',
+    re.IGNORECASE
+)
+SPANISH_PUNCT_RE = re.compile(r'[¿¡]')
+ESZETT_RE = re.compile(r'ß')
+
 def check_book_language(title, isbn=None, open_library_key=None):
     """
     Check why a book would be flagged as non-English (same logic as cleanup function)
@@ -23,70 +64,35 @@ def check_book_language(title, isbn=None, open_library_key=None):
     if not title:
         return reasons
     
-    # Pattern matching
-    non_english_languages = (
-        'french|russian|spanish|german|italian|portuguese|chinese|japanese|korean|arabic|hebrew|'
-        'polish|dutch|swedish|norwegian|danish|finnish|greek|turkish|hindi|thai|vietnamese|'
-        'indonesian|malay|tagalog|romanian|hungarian|czech|slovak|croatian|serbian|bulgarian|'
-        'ukrainian|persian|urdu|bengali|tamil|telugu|marathi|gujarati|kannada|malayalam|'
-        'punjabi|nepali|sinhala|myanmar|khmer|lao|mongolian|georgian|armenian|azerbaijani|'
-        'kazakh|uzbek|turkmen|kyrgyz|tajik|afrikaans|swahili|zulu|xhosa|amharic|hausa|'
-        'yoruba|igbo|somali|maltese|icelandic|basque|catalan|galician|welsh|irish|scottish|'
-        'breton|cornish|manx'
-    )
-    
-    paren_pattern = re.compile(
-        rf'\([^)]*(?:{non_english_languages})\s*(?:edition|version|translation)?[^)]*\)',
-        re.IGNORECASE
-    )
-    bracket_pattern = re.compile(
-        rf'\[[^\]]*(?:{non_english_languages})\s*(?:edition|version|translation)?[^\]]*\]',
-        re.IGNORECASE
-    )
-    standalone_pattern = re.compile(
-        rf'\b(?:{non_english_languages})\s+(?:edition|version|translation)\b',
-        re.IGNORECASE
-    )
-    spanish_indicators = re.compile(
-        r'\b(?:edici[oó]n|colecci[oó]n|estuche|libro|libros|misterio|pr[ií]ncipe)\b',
-        re.IGNORECASE
-    )
-    
     # Check patterns
-    if paren_pattern.search(title):
-        match = paren_pattern.search(title)
+    match = PAREN_RE.search(title)
+    if match:
         reasons.append(f"Language edition in parentheses: '{match.group()}'")
-    if bracket_pattern.search(title):
-        match = bracket_pattern.search(title)
+    match = BRACKET_RE.search(title)
+    if match:
         reasons.append(f"Language edition in brackets: '{match.group()}'")
-    if standalone_pattern.search(title):
-        match = standalone_pattern.search(title)
-        reasons.append(f"Standalone language edition: '{match.group()}'")
-    if 'house edition' not in title.lower() and spanish_indicators.search(title):
-        match = spanish_indicators.search(title)
-        reasons.append(f"Spanish text indicator: '{match.group()}'")
-    
-    # Character-based detection
-    major_non_english_pattern = re.compile(
-        r'[\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff\u0400-\u04ff\u0600-\u06ff\u0590-\u05ff]'
-    )
-    if major_non_english_pattern.search(title):
-        reasons.append("Non-English script detected (CJK/Cyrillic/Arabic/Hebrew)")
-    
-    accented_chars_pattern = re.compile(
-        r'[àáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿąćčđęěğıłńňřśşšťůźżž]',
-        re.IGNORECASE
-    )
-    spanish_punct = re.compile(r'[¿¡]')
-    german_eszett = re.compile(r'ß')
-    
-    if spanish_punct.search(title):
-        reasons.append("Spanish punctuation (¿ or ¡)")
-    if german_eszett.search(title):
-        reasons.append("German ß character")
-    if accented_chars_pattern.search(title):
-        accented_count = len(accented_chars_pattern.findall(title))
-        total_alpha_chars = len([c for c in title if c.isalpha()])
+    if EDITION_WORD_RE.search(title):
+        match = STANDALONE_RE.search(title)
+        if match:
+            reasons.append(f"Standalone language edition: '{match.group()}'")
+    if 'house edition' not in title.lower():
+        match = SPANISH_IND_RE.search(title)
+        if match:
+            reasons.append(f"Spanish text indicator: '{match.group()}'")
+    
+    # Character-based detection (these scripts and characters are all non-ASCII)
+    if not title.isascii():
+        if MAJOR_NON_ENG_RE.search(title):
+            reasons.append("Non-English script detected (CJK/Cyrillic/Arabic/Hebrew)")
+        
+        if SPANISH_PUNCT_RE.search(title):
+            reasons.append("Spanish punctuation (¿ or ¡)")
+        if ESZETT_RE.search(title):
+            reasons.append("German ß character")
+    # One findall both detects and counts accented characters
+    accented_count = len(ACCENTED_RE.findall(title))
+    if accented_count:
+        total_alpha_chars = sum(map(str.isalpha, title))
         if total_alpha_chars > 0:
             ratio = accented_count / total_alpha_chars
             if ratio > 0.05 or (len(title) < 15 and accented_count >= 2) or accented_count >= 3:
@@ -94,8 +100,8 @@ def check_book_language(title, isbn=None, open_library_key=None):
     
     return reasons
 
-def verify_cleanup_results(limit=None, offset=0, sample_size=20, dry_run_check=True):
-    """Show sample of what would be removed"""
+def verify_cleanup_results(limit=None, offset=0, sample_size=20, dry_run_check=True, output_file=None):
+    """Show sample of what would be removed (optionally writing every flagged book to a CSV file)"""
     db_path = Path(__file__).parent.parent / 'data' / 'bookpilot.db'
     engine = init_db(str(db_path))
     session = get_session(engine)
@@ -108,37 +114,55 @@ def verify_cleanup_results(limit=None, offset=0, sample_size=20, dry_run_check=T
     print("=" * 80)
     print()
     
-    # Get all catalog books
-    query = session.query(AuthorCatalogBook).order_by(AuthorCatalogBook.id)
+    # Stream just the columns the check needs rather than loading every ORM object
+    query = session.query(
+        AuthorCatalogBook.id,
+        AuthorCatalogBook.title,
+        AuthorCatalogBook.isbn,
+        AuthorCatalogBook.open_library_key,
+        AuthorCatalogBook.author_id
+    ).order_by(AuthorCatalogBook.id)
     if offset:
         query = query.offset(offset)
     if limit:
         query = query.limit(limit)
-    catalog_books = query.all()
+    catalog_books = query.yield_per(1000)
     
     total_in_db = session.query(AuthorCatalogBook).count()
-    print(f"Checking {len(catalog_books)} books (of {total_in_db} total in database)...\n")
+    checking_count = max(total_in_db - offset, 0)
+    if limit:
+        checking_count = min(checking_count, limit)
+    print(f"Checking {checking_count} books (of {total_in_db} total in database)...\n")
     
     # Check each book
     flagged_books = []
     for book in catalog_books:
         reasons = check_book_language(book.title, book.isbn, book.open_library_key)
         if reasons:
-            # Get author name
-            try:
-                author = session.query(Author).filter_by(id=book.author_id).first()
-                author_name = author.name if author else f"Author ID {book.author_id}"
-            except:
-                author_name = f"Author ID {book.author_id}"
-            
             flagged_books.append({
                 'id': book.id,
                 'title': book.title,
-                'author': author_name,
+                'author_id': book.author_id,
+                'author': f"Author ID {book.author_id}",
                 'isbn': book.isbn,
                 'reasons': reasons
             })
     
+    # Look up author names for the flagged books in chunks rather than one query per book
+    author_ids = list({book['author_id'] for book in flagged_books if book['author_id'] is not None})
+    author_names = {}
+    try:
+        for start in range(0, len(author_ids), 500):
+            author_names.update(
+                session.query(Author.id, Author.name).filter(Author.id.in_(author_ids[start:start + 500]))
+            )
+    except Exception:
+        # If the lookup fails, keep the "Author ID" fallback names
+        pass
+    for book in flagged_books:
+        if book['author_id'] in author_names:
+            book['author'] = author_names[book['author_id']]
+    
     print(f"Found {len(flagged_books)} books that would be flagged as non-English\n")
     
     if flagged_books:
@@ -162,17 +186,27 @@ def verify_cleanup_results(limit=None, offset=0, sample_size=20, dry_run_check=T
         
         # Show breakdown by reason type
         print("\nBreakdown by detection method:")
-        reason_types = {}
+        reason_types = Counter()
         for book in flagged_books:
-            for reason in book['reasons']:
-                reason_type = reason.split(':')[0] if ':' in reason else reason
-                reason_types[reason_type] = reason_types.get(reason_type, 0) + 1
+            reason_types.update(reason.split(':', 1)[0] for reason in book['reasons'])
         
-        for reason_type, count in sorted(reason_types.items(), key=lambda x: -x[1]):
+        for reason_type, count in reason_types.most_common():
             print(f"  {reason_type}: {count} books")
     else:
         print("✓ No non-English books found in this batch")
     
+    # Full results go to a file in one write rather than being printed book by book
+    if output_file:
+        output_path = Path(output_file)
+        with open(output_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['id', 'title', 'author', 'isbn', 'reasons'])
+            writer.writerows(
+                (book['id'], book['title'], book['author'], book['isbn'] or '', ' | '.join(book['reasons']))
+                for book in flagged_books
+            )
+        print(f"\n✓ All {len(flagged_books)} flagged books saved to: {output_path}")
+    
     session.close()
 
 if __name__ == '__main__':
@@ -181,6 +215,8 @@ if __name__ == '__main__':
     parser.add_argument('--limit', type=int, help='Limit number of books to check')
     parser.add_argument('--offset', type=int, default=0, help='Offset for batch processing')
     parser.add_argument('--sample-size', type=int, default=20, help='Number of examples to show')
+    parser.add_argument('--output', type=str, help='Write all flagged books to this CSV file')
     args = parser.parse_args()
     
-    verify_cleanup_results(limit=args.limit, offset=args.offset, sample_size=args.sample_size)
+    verify_cleanup_results(limit=args.limit, offset=args.offset, sample_size=args.sample_size,
+                           output_file=args.output)
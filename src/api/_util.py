@@ -0,0 +1,40 @@
+"""Helpers shared by the API clients"""
+import re
+from functools import lru_cache
+
+
+# Filesystem-unsafe characters (/ \ ' " ? * < > | : & and control characters) all map to '_'
+FILENAME_UNSAFE_TRANS = str.maketrans(
+    {c: '_' for c in '/\\\'"<>|:*?&' + ''.join(chr(i) for i in range(32)) + chr(127)}
+)
+UNDERSCORE_RUN_RE = re.compile(r'_{2,}')
+# Non-English scripts (CJK, Cyrillic, Arabic, Hebrew) for the title fallback in is_english_language
+NON_ENGLISH_SCRIPT_RE = re.compile(r'[\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff\u0400-\u04ff\u0600-\u06ff\u0590-\u05ff]')
+
+
+@lru_cache(maxsize=10000)
+def sanitize_filename(text: str) -> str:
+    """
+    Sanitize a string to be safe for use as a filename.
+    
+    Replaces all problematic characters that can cause issues with:
+    - Cloud sync and filesystems (apostrophes, forward slashes)
+    - Windows filenames (colons, angle brackets, pipes, etc.)
+    - Unix filenames (forward slashes)
+    - General filesystem issues
+    
+    Args:
+        text: The string to sanitize
+        
+    Returns:
+        A sanitized string safe for use in filenames
+    """
+    # Replace problematic characters (including control characters) with underscores
+    # in a single pass, then collapse runs of underscores to a single underscore
+    safe = UNDERSCORE_RUN_RE.sub('_', text.translate(FILENAME_UNSAFE_TRANS))
+    # Remove leading/trailing underscores and spaces
+    safe = safe.strip('_ ')
+    # If empty after sanitization, use a default value
+    if not safe:
+        safe = 'empty'
+    return safe
@@ -1,42 +1,18 @@
 """Google Books API client"""
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import re
 from typing import Dict, List, Optional
 from pathlib import Path
 import json
+import sqlite3
+import threading
+from ._util import sanitize_filename, NON_ENGLISH_SCRIPT_RE
 
 
-def sanitize_filename(text: str) -> str:
-    """
-    Sanitize a string to be safe for use as a filename.
-    
-    Replaces all problematic characters that can cause issues with:
-    - Cloud sync and filesystems (apostrophes, forward slashes)
-    - Windows filenames (colons, angle brackets, pipes, etc.)
-    - Unix filenames (forward slashes)
-    - General filesystem issues
-    
-    Args:
-        text: The string to sanitize
-        
-    Returns:
-        A sanitized string safe for use in filenames
-    """
-    # Replace problematic characters with underscores
-    # Characters that are problematic: / \ ' " ? * < > | : & and control characters
-    # Also replace multiple consecutive underscores/spaces with a single underscore
-    safe = re.sub(r'[/\\\'"<>|:*?&]', '_', text)
-    # Replace control characters (0x00-0x1F and 0x7F)
-    safe = re.sub(r'[\x00-\x1F\x7F]', '_', safe)
-    # Replace multiple consecutive underscores with a single underscore
-    safe = re.sub(r'_+', '_', safe)
-    # Remove leading/trailing underscores and spaces
-    safe = safe.strip('_ ')
-    # If empty after sanitization, use a default value
-    if not safe:
-        safe = 'empty'
-    return safe
+# Book/number marker in subtitles, for extract_series_info
+SERIES_NUMBER_RE = re.compile(r'(?:book|#)\s*(\d+)')
 
 
 class GoogleBooksClient:
@@ -44,6 +20,7 @@ class GoogleBooksClient:
     
     BASE_URL = "https://www.googleapis.com/books/v1"
     CACHE_DIR = Path(__file__).parent.parent.parent / 'data' / 'cache' / 'googlebooks'
+    CACHE_DB = CACHE_DIR / 'cache.sqlite'
     
     def __init__(self, cache_enabled=True, rate_limit_delay=0.5):
         """
@@ -53,12 +30,40 @@ class GoogleBooksClient:
         """
         self.cache_enabled = cache_enabled
         self.rate_limit_delay = rate_limit_delay
+        # Reuse pooled connections so repeat calls skip the TCP/TLS handshake
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=16))
+        self._cache_db = None
+        self._cache_lock = threading.Lock()
+        # Monotonic start time of the last API call, for rate limiting
+        self._last_request_time = 0.0
+        self._rate_limit_lock = threading.Lock()
         if cache_enabled:
             self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            self._cache_db = self._open_cache_db()
+    
+    def _open_cache_db(self) -> Optional[sqlite3.Connection]:
+        """
+        Open the single-file response cache.
+        
+        All responses live in one SQLite table instead of one JSON file each, which
+        avoids a file create/open per response (slow on cloud-synced folders).
+        Returns None if the database can't be opened; responses then go uncached.
+        """
+        try:
+            conn = sqlite3.connect(str(self.CACHE_DB), timeout=30.0, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, data TEXT NOT NULL)')
+            conn.commit()
+            return conn
+        except sqlite3.Error as e:
+            print(f"Google Books cache unavailable ({e}); continuing without cache")
+            return None
     
     def _get_cache_path(self, cache_key: str) -> Path:
         """
-        Get cache file path for a key.
+        Get the legacy per-response cache file path for a key (read-only fallback).
         
         Note: This sanitization changed from the original implementation to handle
         problematic characters (apostrophes, slashes, etc.) for cloud sync and cross-platform compatibility.
@@ -71,31 +76,61 @@ class GoogleBooksClient:
     
     def _get_cached(self, cache_key: str) -> Optional[Dict]:
         """Get cached response"""
-        if not self.cache_enabled:
+        if not self.cache_enabled or self._cache_db is None:
             return None
         
+        try:
+            with self._cache_lock:
+                row = self._cache_db.execute(
+                    'SELECT data FROM cache WHERE key = ?', (cache_key,)
+                ).fetchone()
+            if row:
+                return json.loads(row[0])
+        except (sqlite3.Error, ValueError):
+            return None
+        
+        # Fall back to a per-response JSON file written by older versions, and move
+        # it into the cache database so the next lookup is served from there
         cache_path = self._get_cache_path(cache_key)
         if cache_path.exists():
             try:
                 with open(cache_path, 'r') as f:
-                    return json.load(f)
+                    data = json.load(f)
             except:
                 return None
+            self._set_cache(cache_key, data)
+            return data
         return None
     
     def _set_cache(self, cache_key: str, data: Dict):
         """Cache response"""
-        if not self.cache_enabled:
+        if not self.cache_enabled or self._cache_db is None:
             return
         
-        cache_path = self._get_cache_path(cache_key)
         try:
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(cache_path, 'w') as f:
-                json.dump(data, f, indent=2)
-        except:
+            payload = json.dumps(data, separators=(',', ':'))
+            with self._cache_lock:
+                self._cache_db.execute(
+                    'INSERT OR REPLACE INTO cache (key, data) VALUES (?, ?)', (cache_key, payload)
+                )
+                self._cache_db.commit()
+        except (sqlite3.Error, TypeError, ValueError):
             pass
     
+    def _wait_for_rate_limit(self):
+        """
+        Keep API calls at least rate_limit_delay seconds apart.
+        
+        Only sleeps for whatever is left of the delay since the last call started,
+        so a call made long after the previous one (e.g. after a run of cache hits
+        or slow processing) goes out immediately.
+        """
+        with self._rate_limit_lock:
+            wait = self.rate_limit_delay - (time.monotonic() - self._last_request_time)
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request_time = time.monotonic()
+    
     def _request(self, endpoint: str, params: Dict = None) -> Dict:
         """Make API request with caching, rate limiting, and 429 retry with backoff"""
         cache_key = f"{endpoint}_{params or ''}"
@@ -106,13 +141,13 @@ class GoogleBooksClient:
             return cached
         
         # Rate limiting
-        time.sleep(self.rate_limit_delay)
+        self._wait_for_rate_limit()
         
         url = f"{self.BASE_URL}{endpoint}"
         max_retries = 2  # Initial attempt + up to 2 retries on 429
         for attempt in range(max_retries + 1):
             try:
-                response = requests.get(url, params=params, timeout=10)
+                response = self.session.get(url, params=params, timeout=10)
                 if response.status_code == 429:
                     # Too Many Requests - back off and retry
                     try:
@@ -181,7 +216,7 @@ class GoogleBooksClient:
     def extract_description(self, volume_data: Dict) -> Optional[str]:
         """Extract description from volume data"""
         volume_info = volume_data.get('volumeInfo', {})
-        return volume_info.get('description') or volume_info.get('description', '')
+        return volume_info.get('description', '')
     
     def extract_series_info(self, volume_data: Dict) -> tuple:
         """
@@ -198,8 +233,7 @@ class GoogleBooksClient:
         # Check subtitle for series indicators
         if subtitle:
             # Look for patterns like "Book 2" or "#2" in subtitle
-            import re
-            match = re.search(r'(?:book|#)\s*(\d+)', subtitle.lower())
+            match = SERIES_NUMBER_RE.search(subtitle.lower())
             if match:
                 # Try to extract series name from title or subtitle
                 series_name = title  # Fallback to title
@@ -228,13 +262,10 @@ class GoogleBooksClient:
         
         # If no language info, check title for non-English characters as fallback
         title = volume_info.get('title', '')
-        if title:
+        if title and not title.isascii():
             # Check for common non-English character ranges
             # CJK (Chinese, Japanese, Korean), Cyrillic, Arabic, Hebrew, etc.
-            import re
-            # Pattern matches characters outside basic Latin, extended Latin, and common punctuation
-            non_english_pattern = re.compile(r'[\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff\u0400-\u04ff\u0600-\u06ff\u0590-\u05ff]')
-            if non_english_pattern.search(title):
+            if NON_ENGLISH_SCRIPT_RE.search(title):
                 # Found non-English characters, likely not English
                 return False
         
@@ -5,38 +5,7 @@ import re
 from typing import Dict, List, Optional
 from pathlib import Path
 import json
-
-
-def sanitize_filename(text: str) -> str:
-    """
-    Sanitize a string to be safe for use as a filename.
-    
-    Replaces all problematic characters that can cause issues with:
-    - Cloud sync and filesystems (apostrophes, forward slashes)
-    - Windows filenames (colons, angle brackets, pipes, etc.)
-    - Unix filenames (forward slashes)
-    - General filesystem issues
-    
-    Args:
-        text: The string to sanitize
-        
-    Returns:
-        A sanitized string safe for use in filenames
-    """
-    # Replace problematic characters with underscores
-    # Characters that are problematic: / \ ' " ? * < > | : & and control characters
-    # Also replace multiple consecutive underscores/spaces with a single underscore
-    safe = re.sub(r'[/\\\'"<>|:*?&]', '_', text)
-    # Replace control characters (0x00-0x1F and 0x7F)
-    safe = re.sub(r'[\x00-\x1F\x7F]', '_', safe)
-    # Replace multiple consecutive underscores with a single underscore
-    safe = re.sub(r'_+', '_', safe)
-    # Remove leading/trailing underscores and spaces
-    safe = safe.strip('_ ')
-    # If empty after sanitization, use a default value
-    if not safe:
-        safe = 'empty'
-    return safe
+from ._util import sanitize_filename, NON_ENGLISH_SCRIPT_RE
 
 
 class OpenLibraryClient:
@@ -92,8 +61,8 @@ class OpenLibraryClient:
         cache_path = self._get_cache_path(cache_key)
         try:
             cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(cache_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Compact separators: no pretty-printing, smaller files to write and read back
+            cache_path.write_text(json.dumps(data, separators=(',', ':')))
         except:
             pass
     
@@ -279,13 +248,10 @@ def is_english_language(work_data: Dict, edition_data: Dict = None) -> bool:
     
     # If no language info, check title for non-English characters as fallback
     title = work_data.get('title', '') or (edition_data.get('title', '') if edition_data else '')
-    if title:
+    if title and not title.isascii():
         # Check for common non-English character ranges
         # CJK (Chinese, Japanese, Korean), Cyrillic, Arabic, Hebrew, etc.
-        import re
-        # Pattern matches characters outside basic Latin, extended Latin, and common punctuation
-        non_english_pattern = re.compile(r'[\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff\u0400-\u04ff\u0600-\u06ff\u0590-\u05ff]')
-        if non_english_pattern.search(title):
+        if NON_ENGLISH_SCRIPT_RE.search(title):
             # Found non-English characters, likely not English
             return False
     
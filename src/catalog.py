@@ -2,6 +2,7 @@
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
 import requests
 from .models import Author, AuthorCatalogBook, Book, SystemMetadata
 from .api.openlibrary import OpenLibraryClient, extract_series_info, extract_isbn, is_english_language
@@ -892,10 +893,11 @@ def cleanup_non_english_books(db_session: Session, dry_run: bool = False, limit:
     catalog_books = query.all()
     total = len(catalog_books)
     
-    total_in_db = db_session.query(AuthorCatalogBook).count()
     if catalog_book_ids:
         print(f"  Processing {total} books (scoped to given IDs)...")
     elif limit or offset:
+        # Only batched runs report the table size, so only they pay for the COUNT
+        total_in_db = db_session.query(AuthorCatalogBook).count()
         range_str = f"books {offset + 1}-{offset + total}" if limit else f"books starting from {offset + 1}"
         print(f"  Processing {total} books ({range_str} of {total_in_db} total)...")
     removed = 0
@@ -978,6 +980,9 @@ def cleanup_non_english_books(db_session: Session, dry_run: bool = False, limit:
                 rf'\b(?:{non_english_languages})\s+(?:edition|version|translation)\b',
                 re.IGNORECASE
             )
+            # Literal prefilter: a standalone match always contains one of these words,
+            # so titles without them skip trying the language alternation at every word
+            edition_word_pattern = re.compile(r'edition|version|translation', re.IGNORECASE)
             # Detect common Spanish words/phrases in titles (indicating Spanish language books)
             # But exclude English "House Edition" titles
             spanish_indicators = re.compile(
@@ -987,14 +992,16 @@ def cleanup_non_english_books(db_session: Session, dry_run: bool = False, limit:
             # Detect non-English indicators
             if (paren_pattern.search(book_title) or 
                 bracket_pattern.search(book_title) or
-                standalone_pattern.search(book_title)):
+                (edition_word_pattern.search(book_title) and standalone_pattern.search(book_title))):
                 is_english = False
             # Check for Spanish indicators (but exclude house editions which are English)
             elif 'house edition' not in book_title.lower() and spanish_indicators.search(book_title):
                 is_english = False
             
             # Check for accented/non-English characters in title
-            if is_english:  # Only check if not already flagged
+            # Every character these checks look for is non-ASCII, so plain ASCII
+            # titles - the vast majority - skip them entirely
+            if is_english and not book_title.isascii():  # Only check if not already flagged
                 # First, check for major non-English scripts (CJK, Cyrillic, Arabic, Hebrew)
                 # This is the same check used in the API functions
                 major_non_english_pattern = re.compile(
@@ -1068,21 +1075,10 @@ def cleanup_non_english_books(db_session: Session, dry_run: bool = False, limit:
         # Remove if not English
         if not is_english:
             # Values already stored at the start of the loop (including book_author_id)
-            
-            # Get author name for display (query with no_autoflush to avoid premature flush)
-            author_name = f"Author ID {book_author_id}"
-            try:
-                with db_session.no_autoflush:
-                    author = db_session.query(Author).filter_by(id=book_author_id).first()
-                    if author:
-                        author_name = author.name
-            except Exception as e:
-                # If query fails, use the fallback author_name we set above
-                pass
-            
+            # Author name for display is filled in after the loop with one batched query
             non_english_books.append({
                 'title': book_title,
-                'author': author_name,
+                'author': f"Author ID {book_author_id}",
                 'author_id': book_author_id,
                 'isbn': book_isbn
             })
@@ -1111,6 +1107,23 @@ def cleanup_non_english_books(db_session: Session, dry_run: bool = False, limit:
             else:
                 removed += 1
     
+    # Look up author names for the flagged books in chunks rather than one query per book
+    # (no_autoflush so pending deletions are not flushed early)
+    author_ids = list({book['author_id'] for book in non_english_books if book['author_id'] is not None})
+    author_names = {}
+    try:
+        with db_session.no_autoflush:
+            for start in range(0, len(author_ids), 500):
+                author_names.update(
+                    db_session.query(Author.id, Author.name).filter(Author.id.in_(author_ids[start:start + 500]))
+                )
+    except SQLAlchemyError as e:
+        # If the lookup fails, keep the "Author ID" fallback names
+        print(f"  ⚠ Warning: Could not look up author names: {e}")
+    for book in non_english_books:
+        if book['author_id'] in author_names:
+            book['author'] = author_names[book['author_id']]
+    
     if not dry_run:
         try:
             db_session.commit()
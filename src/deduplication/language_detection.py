@@ -11,6 +11,77 @@ import re
 from typing import Optional, Tuple
 
 
+# Patterns are compiled once at import; detect_non_english_title runs for every
+# catalog book in recommendation filtering and the cleanup scripts
+
+# Method 1: Character set detection (CJK, Cyrillic, Arabic, Hebrew, etc.)
+_MAJOR_NON_ENGLISH_RE = re.compile(
+    r'[\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff\u0400-\u04ff\u0600-\u06ff\u0590-\u05ff]'
+)
+
+# Method 2: Hebrew characters: א-ת (U+05D0 to U+05EA)
+_HEBREW_CHARS_RE = re.compile(r'[\u05d0-\u05ea]')
+
+# Hebrew transliteration patterns, as one alternation so each title is scanned once
+_HEBREW_TRANSLITERATION_RE = re.compile(
+    r'\b(?:'
+    r'sheloshah\b'  # "three" in Hebrew transliteration
+    r'|shel\b'  # "of" in Hebrew
+    r'|be-'  # "in" in Hebrew (with hyphen)
+    r'|ve-'  # "and" in Hebrew (with hyphen)
+    r'|shavu[\u05b0-\u05ff]ot\b'  # "weeks" in Hebrew (with Hebrew vowel marks)
+    r')',
+    re.IGNORECASE
+)
+
+# Method 3: Language edition markers in parentheses/brackets
+_NON_ENGLISH_LANGUAGES = (
+    'french|russian|spanish|german|italian|portuguese|chinese|japanese|korean|arabic|hebrew|'
+    'polish|dutch|swedish|norwegian|danish|finnish|greek|turkish|hindi|thai|vietnamese|'
+    'indonesian|malay|tagalog|romanian|hungarian|czech|slovak|croatian|serbian|bulgarian|'
+    'ukrainian|persian|urdu|bengali|tamil|telugu|marathi|gujarati|kannada|malayalam|'
+    'punjabi|nepali|sinhala|myanmar|khmer|lao|mongolian|georgian|armenian|azerbaijani|'
+    'kazakh|uzbek|turkmen|kyrgyz|tajik|afrikaans|swahili|zulu|xhosa|amharic|hausa|'
+    'yoruba|igbo|somali|maltese|icelandic|basque|catalan|galician|welsh|irish|scottish|'
+    'breton|cornish|manx|hebrew'
+)
+_PAREN_EDITION_RE = re.compile(
+    rf'\([^)]*(?:{_NON_ENGLISH_LANGUAGES})\s*(?:edition|version|translation)?[^)]*\)',
+    re.IGNORECASE
+)
+_BRACKET_EDITION_RE = re.compile(
+    rf'\[[^\]]*(?:{_NON_ENGLISH_LANGUAGES})\s*(?:edition|version|translation)?[^\]]*\]',
+    re.IGNORECASE
+)
+_STANDALONE_EDITION_RE = re.compile(
+    rf'\b(?:{_NON_ENGLISH_LANGUAGES})\s+(?:edition|version|translation)\b',
+    re.IGNORECASE
+)
+# Every standalone edition match contains one of these words; checking for them
+# first is far cheaper than trying the language alternation at each word
+_EDITION_WORD_RE = re.compile(r'edition|version|translation', re.IGNORECASE)
+
+# Method 4: Spanish indicators
+_SPANISH_INDICATORS_RE = re.compile(
+    r'\b(?:edici[oó]n|colecci[oó]n|estuche|libro|libros|misterio|pr[ií]ncipe)\b',
+    re.IGNORECASE
+)
+
+# Method 5: Specific non-English punctuation/characters
+_SPANISH_PUNCT_RE = re.compile(r'[¿¡]')
+_GERMAN_ESZETT_RE = re.compile(r'ß')
+
+# Method 6: Suspicious encoding/typo patterns
+_X_PREFIX_RE = re.compile(r'^X[a-z]{2,}', re.IGNORECASE)
+
+# Method 7: Non-English word patterns
+# Common non-English articles and prepositions
+_NON_ENGLISH_ARTICLE_RES = [
+    re.compile(r'\b(?:le|la|les|un|une|des|du|de|el|los|las|una|uno|der|die|das|ein|eine)\s+[A-Z]', re.IGNORECASE),  # Articles before capitalized words
+    re.compile(r'\b(?:van|von|de|del|da|di|du|des)\s+[A-Z]', re.IGNORECASE),  # Name particles (but these can be in English names too, so be careful)
+]
+
+
 def detect_non_english_title(title: str, isbn: Optional[str] = None, 
                              open_library_key: Optional[str] = None) -> Tuple[bool, list]:
     """
@@ -30,94 +101,57 @@ def detect_non_english_title(title: str, isbn: Optional[str] = None,
     
     reasons = []
     
+    # The script and special-character checks (methods 1, 2 and 5) can only match
+    # non-ASCII text, so plain ASCII titles - the vast majority - skip them
+    is_ascii = title.isascii()
+    
     # Method 1: Character set detection (CJK, Cyrillic, Arabic, Hebrew, etc.)
-    major_non_english_pattern = re.compile(
-        r'[\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff\u0400-\u04ff\u0600-\u06ff\u0590-\u05ff]'
-    )
-    if major_non_english_pattern.search(title):
+    if not is_ascii and _MAJOR_NON_ENGLISH_RE.search(title):
         reasons.append("Non-English script detected (CJK/Cyrillic/Arabic/Hebrew)")
         return True, reasons
     
     # Method 2: Hebrew-specific patterns
     # Hebrew words often transliterated: "be-" (in), "shel-" (of), "ve-" (and)
-    # Hebrew characters: א-ת (U+05D0 to U+05EA)
-    hebrew_chars = re.compile(r'[\u05d0-\u05ea]')
-    if hebrew_chars.search(title):
+    if not is_ascii and _HEBREW_CHARS_RE.search(title):
         reasons.append("Hebrew characters detected")
         return True, reasons
     
     # Hebrew transliteration patterns
-    hebrew_patterns = [
-        r'\bsheloshah\b',  # "three" in Hebrew transliteration
-        r'\bshel\b',  # "of" in Hebrew
-        r'\bbe-',  # "in" in Hebrew (with hyphen)
-        r'\bve-',  # "and" in Hebrew (with hyphen)
-        r'\bshavu[\u05b0-\u05ff]ot\b',  # "weeks" in Hebrew (with Hebrew vowel marks)
-    ]
-    for pattern in hebrew_patterns:
-        if re.search(pattern, title, re.IGNORECASE):
-            reasons.append("Hebrew transliteration pattern detected")
-            return True, reasons
+    if _HEBREW_TRANSLITERATION_RE.search(title):
+        reasons.append("Hebrew transliteration pattern detected")
+        return True, reasons
     
     # Method 3: Language edition markers in parentheses/brackets
-    non_english_languages = (
-        'french|russian|spanish|german|italian|portuguese|chinese|japanese|korean|arabic|hebrew|'
-        'polish|dutch|swedish|norwegian|danish|finnish|greek|turkish|hindi|thai|vietnamese|'
-        'indonesian|malay|tagalog|romanian|hungarian|czech|slovak|croatian|serbian|bulgarian|'
-        'ukrainian|persian|urdu|bengali|tamil|telugu|marathi|gujarati|kannada|malayalam|'
-        'punjabi|nepali|sinhala|myanmar|khmer|lao|mongolian|georgian|armenian|azerbaijani|'
-        'kazakh|uzbek|turkmen|kyrgyz|tajik|afrikaans|swahili|zulu|xhosa|amharic|hausa|'
-        'yoruba|igbo|somali|maltese|icelandic|basque|catalan|galician|welsh|irish|scottish|'
-        'breton|cornish|manx|hebrew'
-    )
-    
-    paren_pattern = re.compile(
-        rf'\([^)]*(?:{non_english_languages})\s*(?:edition|version|translation)?[^)]*\)',
-        re.IGNORECASE
-    )
-    bracket_pattern = re.compile(
-        rf'\[[^\]]*(?:{non_english_languages})\s*(?:edition|version|translation)?[^\]]*\]',
-        re.IGNORECASE
-    )
-    standalone_pattern = re.compile(
-        rf'\b(?:{non_english_languages})\s+(?:edition|version|translation)\b',
-        re.IGNORECASE
-    )
-    
-    if paren_pattern.search(title):
-        match = paren_pattern.search(title)
+    match = _PAREN_EDITION_RE.search(title)
+    if match:
         reasons.append(f"Language edition in parentheses: '{match.group()}'")
         return True, reasons
-    if bracket_pattern.search(title):
-        match = bracket_pattern.search(title)
+    match = _BRACKET_EDITION_RE.search(title)
+    if match:
         reasons.append(f"Language edition in brackets: '{match.group()}'")
         return True, reasons
-    if standalone_pattern.search(title):
-        match = standalone_pattern.search(title)
-        reasons.append(f"Standalone language edition: '{match.group()}'")
-        return True, reasons
+    if _EDITION_WORD_RE.search(title):
+        match = _STANDALONE_EDITION_RE.search(title)
+        if match:
+            reasons.append(f"Standalone language edition: '{match.group()}'")
+            return True, reasons
     
     # Method 4: Spanish indicators
-    spanish_indicators = re.compile(
-        r'\b(?:edici[oó]n|colecci[oó]n|estuche|libro|libros|misterio|pr[ií]ncipe)\b',
-        re.IGNORECASE
-    )
-    if 'house edition' not in title.lower() and spanish_indicators.search(title):
-        match = spanish_indicators.search(title)
-        reasons.append(f"Spanish text indicator: '{match.group()}'")
-        return True, reasons
+    if 'house edition' not in title.lower():
+        match = _SPANISH_INDICATORS_RE.search(title)
+        if match:
+            reasons.append(f"Spanish text indicator: '{match.group()}'")
+            return True, reasons
     
     # Method 5: Specific non-English punctuation/characters
     # Check for specific non-English characters that are clear indicators
-    spanish_punct = re.compile(r'[¿¡]')
-    german_eszett = re.compile(r'ß')
-    
-    if spanish_punct.search(title):
-        reasons.append("Spanish punctuation (¿ or ¡)")
-        return True, reasons
-    if german_eszett.search(title):
-        reasons.append("German ß character")
-        return True, reasons
+    if not is_ascii:
+        if _SPANISH_PUNCT_RE.search(title):
+            reasons.append("Spanish punctuation (¿ or ¡)")
+            return True, reasons
+        if _GERMAN_ESZETT_RE.search(title):
+            reasons.append("German ß character")
+            return True, reasons
     
     # Note: Removed "high accented character ratio" check as it was causing false positives
     # (flagging regular 'i' characters in English titles)
@@ -125,7 +159,7 @@ def detect_non_english_title(title: str, isbn: Optional[str] = None,
     # Method 6: Suspicious encoding/typo patterns
     # Patterns like "Xjust" at start, unusual character sequences
     # "Xjust Rewards Tegf" - X at start + weird capitalization
-    if re.search(r'^X[a-z]{2,}', title, re.IGNORECASE):
+    if _X_PREFIX_RE.search(title):
         # Check if it's a known acronym (XML, XHTML, etc.)
         known_acronyms = ['xml', 'xhtml', 'xaml', 'xpath', 'xslt', 'xquery']
         first_word = title.split()[0].lower() if title.split() else ''
@@ -151,16 +185,11 @@ def detect_non_english_title(title: str, isbn: Optional[str] = None,
                 return True, reasons
     
     # Method 7: Non-English word patterns
-    # Common non-English articles and prepositions
-    non_english_articles = [
-        r'\b(?:le|la|les|un|une|des|du|de|el|los|las|una|uno|der|die|das|ein|eine)\s+[A-Z]',  # Articles before capitalized words
-        r'\b(?:van|von|de|del|da|di|du|des)\s+[A-Z]',  # Name particles (but these can be in English names too, so be careful)
-    ]
     # Only flag if title is mostly non-English words
     title_words = title.split()
     if len(title_words) > 2:
-        for pattern in non_english_articles:
-            matches = len(re.findall(pattern, title, re.IGNORECASE))
+        for pattern in _NON_ENGLISH_ARTICLE_RES:
+            matches = len(pattern.findall(title))
             if matches > 0 and matches / len(title_words) > 0.3:  # More than 30% of words match
                 reasons.append("Non-English article/preposition pattern detected")
                 return True, reasons
@@ -1,8 +1,11 @@
 """Database models for BookPilot"""
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, Float, Text, ForeignKey
+from sqlalchemy import create_engine, event, Column, Computed, Integer, String, DateTime, Boolean, Float, Text, ForeignKey, Index, func, text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
+from functools import lru_cache
+import sqlite3
 
 Base = declarative_base()
 
@@ -14,6 +17,7 @@ class Book(Base):
     id = Column(Integer, primary_key=True)
     title = Column(String, nullable=False)
     author = Column(String, nullable=False)  # Normalized author name
+    author_lc = Column(String, Computed('lower(author)'), index=True)  # Generated by SQLite, for case-insensitive matching
     publisher = Column(String)
     isbn = Column(String)
     format = Column(String)  # 'audiobook' or 'ebook'
@@ -95,6 +99,7 @@ class Recommendation(Base):
     catalog_book_id = Column(Integer, ForeignKey('author_catalog_books.id'), nullable=True)
     title = Column(String, nullable=False)
     author = Column(String, nullable=False)
+    author_lc = Column(String, Computed('lower(author)'), index=True)  # Generated by SQLite, for case-insensitive matching
     isbn = Column(String)
     format = Column(String)  # 'audiobook' or 'ebook'
     category = Column(String)  # Genre/category
@@ -125,22 +130,111 @@ class SystemMetadata(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
+# Author-name lookups compare case-insensitively; expression indexes let
+# func.lower(col) == ... use an index instead of scanning the table
+Index('ix_authors_name_lower', func.lower(Author.name))
+Index('ix_authors_normalized_name_lower', func.lower(Author.normalized_name))
+
+# Series consolidation reads each author's series books in position order
+Index('ix_acb_author_series_position', AuthorCatalogBook.author_id,
+      AuthorCatalogBook.series_name, AuthorCatalogBook.series_position)
+# Children's book detection reads each author's catalog with its categories
+Index('ix_acb_author_cats', AuthorCatalogBook.author_id, AuthorCatalogBook.categories)
+# Unread-catalog scans filter on is_read, globally and per author
+Index('ix_acb_is_read', AuthorCatalogBook.is_read)
+Index('ix_acb_author_id_isread', AuthorCatalogBook.author_id, AuthorCatalogBook.is_read)
+# Read counts and reassignments look up Libby books and recommendations by exact author name
+Index('ix_books_author', Book.author)
+Index('ix_recommendations_author', Recommendation.author)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Configure each new SQLite connection.
+    
+    busy_timeout makes a writer wait for the lock inside SQLite instead of
+    failing with "database is locked"; WAL lets readers (e.g. the web app) keep
+    reading while a CLI script writes.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA busy_timeout=30000")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+# SQLite result codes for lock contention: SQLITE_BUSY, SQLITE_LOCKED and the
+# extended BUSY_RECOVERY / BUSY_SNAPSHOT / BUSY_TIMEOUT variants
+_SQLITE_BUSY_CODES = frozenset({5, 6, 261, 517, 773})
+
+
+def is_database_locked(error):
+    """Check whether an exception is SQLite reporting a busy/locked database"""
+    if not isinstance(error, OperationalError):
+        return False
+    orig = error.orig
+    if not isinstance(orig, sqlite3.OperationalError):
+        return False
+    # sqlite_errorcode is only available on Python 3.11+
+    error_code = getattr(orig, 'sqlite_errorcode', None)
+    if error_code is not None:
+        return error_code in _SQLITE_BUSY_CODES
+    return 'locked' in orig.args[0]
+
+
+def find_author_by_name(session, name):
+    """Find the first author whose name contains `name`, case-insensitively.
+    
+    Tries a prefix match first, which the ix_authors_name_lower index can
+    answer as a range probe, and only scans for a substring match if no
+    name starts with the search text.
+    """
+    prefix = name.lower()
+    author = session.query(Author).filter(
+        func.lower(Author.name) >= prefix,
+        func.lower(Author.name) < prefix + '\U0010ffff'
+    ).order_by(func.lower(Author.name)).first()
+    if author:
+        return author
+    # Escape LIKE wildcards so user input is matched literally
+    escaped = name.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return session.query(Author).filter(
+        Author.name.ilike(f'%{escaped}%', escape='\\')
+    ).first()
+
+
 def init_db(db_path='data/bookpilot.db'):
     """Initialize database"""
     from pathlib import Path
-    Path(db_path).resolve().parent.mkdir(parents=True, exist_ok=True)
+    return _get_engine(str(Path(db_path).resolve()))
+
+
+@lru_cache(maxsize=None)
+def _get_engine(db_path):
+    """Create the engine for a database file once per process.
+    
+    The web app and scripts call init_db() per request/command; caching here
+    keeps the connection pool and skips re-running create_all and migrations.
+    """
+    from pathlib import Path
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
     # Use check_same_thread=False for Flask's multi-threaded environment
     engine = create_engine(f'sqlite:///{db_path}', connect_args={'check_same_thread': False})
+    event.listen(engine, 'connect', _set_sqlite_pragmas)
     Base.metadata.create_all(engine)
     # Run migrations to add any missing columns
     migrate_database(engine)
     return engine
 
 
+@lru_cache(maxsize=None)
+def _get_sessionmaker(engine):
+    """One session factory per engine"""
+    return sessionmaker(bind=engine)
+
+
 def get_session(engine):
     """Get database session"""
-    Session = sessionmaker(bind=engine)
-    return Session()
+    return _get_sessionmaker(engine)()
 
 
 def migrate_database(engine):
@@ -191,6 +285,22 @@ def migrate_database(engine):
                     if 'duplicate column' not in str(e).lower():
                         print(f"  Warning: Could not add hidden_at column to authors table: {e}")
         
+        # Check if books table exists and add the generated author_lc column if needed
+        # (VIRTUAL generated columns are the only kind SQLite can add with ALTER TABLE)
+        if 'books' in inspector.get_table_names():
+            book_columns = [col['name'] for col in inspector.get_columns('books')]
+            if 'author_lc' not in book_columns:
+                try:
+                    conn = sqlite3.connect(db_path, timeout=30.0)
+                    cursor = conn.cursor()
+                    cursor.execute("ALTER TABLE books ADD COLUMN author_lc VARCHAR GENERATED ALWAYS AS (lower(author)) VIRTUAL")
+                    conn.commit()
+                    conn.close()
+                    print(f"✓ Added author_lc column to books table")
+                except sqlite3.OperationalError as e:
+                    if 'duplicate column' not in str(e).lower():
+                        print(f"  Warning: Could not add author_lc column to books table: {e}")
+        
         # Check if recommendations table exists
         if 'recommendations' in inspector.get_table_names():
             # Check which columns exist
@@ -200,7 +310,8 @@ def migrate_database(engine):
             columns_to_add = [
                 ('non_english', 'BOOLEAN DEFAULT 0'),
                 ('already_read', 'BOOLEAN DEFAULT 0'),
-                ('duplicate', 'BOOLEAN DEFAULT 0')
+                ('duplicate', 'BOOLEAN DEFAULT 0'),
+                ('author_lc', 'VARCHAR GENERATED ALWAYS AS (lower(author)) VIRTUAL')
             ]
             
             for col_name, col_def in columns_to_add:
@@ -232,6 +343,31 @@ def migrate_database(engine):
                                         print("  Database may be locked by another process. Please wait and try again.")
                     except Exception as e:
                         print(f"  Warning: Migration error for {col_name}: {e}")
+        
+        # Create indexes declared on the models that existing tables are missing
+        # (create_all only adds indexes when it creates the table itself)
+        table_names = inspector.get_table_names()
+        with engine.connect() as conn:
+            existing_indexes = {
+                row[0] for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))
+            }
+        indexes_added = False
+        for table in Base.metadata.sorted_tables:
+            if table.name not in table_names:
+                continue
+            for index in table.indexes:
+                if index.name in existing_indexes:
+                    continue
+                try:
+                    index.create(engine)
+                    indexes_added = True
+                    print(f"✓ Added {index.name} index to {table.name} table")
+                except Exception as e:
+                    print(f"  Warning: Could not add {index.name} index to {table.name} table: {e}")
+        if indexes_added:
+            # Refresh planner statistics so SQLite starts using the new indexes
+            with engine.begin() as conn:
+                conn.execute(text("ANALYZE"))
     except Exception as e:
         # Migration failed, but don't crash - the app can still work
         print(f"Warning: Database migration check failed: {e}")
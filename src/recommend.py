@@ -1,7 +1,6 @@
 """Recommendation engine"""
 from typing import List, Dict, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from .models import Book, Author, AuthorCatalogBook, Recommendation
 
 
@@ -55,7 +54,7 @@ def count_books_by_author(db_session: Session, normalized_author_name: str, disp
     # Count recommendations marked as already_read
     # Match by display author name (case-insensitive)
     already_read_count = db_session.query(Recommendation).filter(
-        func.lower(Recommendation.author) == display_author_name.lower(),
+        Recommendation.author_lc == display_author_name.lower(),
         Recommendation.already_read == True
     ).count()
     
@@ -1,7 +1,7 @@
 """Series analysis for ebooks"""
 from typing import List, Dict
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
+from sqlalchemy import or_
 from .models import Author, AuthorCatalogBook, Series, Book, Recommendation
 
 
@@ -25,8 +25,8 @@ def analyze_author_series(author: Author, db_session: Session) -> List[Dict]:
     # Check both by exact author name and normalized name
     already_read_recs = db_session.query(Recommendation).filter(
         or_(
-            func.lower(Recommendation.author) == author.name.lower(),
-            func.lower(Recommendation.author) == author.normalized_name.lower()
+            Recommendation.author_lc == author.name.lower(),
+            Recommendation.author_lc == author.normalized_name.lower()
         ),
         Recommendation.already_read.is_(True)
     ).all()
@@ -43,8 +43,8 @@ def analyze_author_series(author: Author, db_session: Session) -> List[Dict]:
     # These should be excluded from the unread_books list
     filtered_recs = db_session.query(Recommendation).filter(
         or_(
-            func.lower(Recommendation.author) == author.name.lower(),
-            func.lower(Recommendation.author) == author.normalized_name.lower()
+            Recommendation.author_lc == author.name.lower(),
+            Recommendation.author_lc == author.normalized_name.lower()
         ),
         or_(
             Recommendation.thumbs_down == True,
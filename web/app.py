@@ -273,7 +273,7 @@ def api_recommendation_feedback(format_type):
         # Find or create recommendation (use case-insensitive matching)
         rec = session.query(Recommendation).filter(
             func.lower(Recommendation.title) == title.lower(),
-            func.lower(Recommendation.author) == author.lower(),
+            Recommendation.author_lc == author.lower(),
             Recommendation.format == format_type
         ).first()
         
@@ -313,7 +313,7 @@ def api_recommendation_feedback(format_type):
                         # Re-query and update
                         rec = session.query(Recommendation).filter(
                             func.lower(Recommendation.title) == title.lower(),
-                            func.lower(Recommendation.author) == author.lower(),
+                            Recommendation.author_lc == author.lower(),
                             Recommendation.format == format_type
                         ).first()
                         if not rec:
@@ -384,7 +384,7 @@ def api_flag_non_english(format_type):
         # Find or create recommendation (use case-insensitive matching)
         rec = session.query(Recommendation).filter(
             func.lower(Recommendation.title) == title.lower(),
-            func.lower(Recommendation.author) == author.lower(),
+            Recommendation.author_lc == author.lower(),
             Recommendation.format == format_type
         ).first()
         
@@ -417,7 +417,7 @@ def api_flag_non_english(format_type):
                         # Re-query and update
                         rec = session.query(Recommendation).filter(
                             func.lower(Recommendation.title) == title.lower(),
-                            func.lower(Recommendation.author) == author.lower(),
+                            Recommendation.author_lc == author.lower(),
                             Recommendation.format == format_type
                         ).first()
                         if not rec:
@@ -482,7 +482,7 @@ def api_flag_already_read(format_type):
         # Find or create recommendation (use case-insensitive matching)
         rec = session.query(Recommendation).filter(
             func.lower(Recommendation.title) == title.lower(),
-            func.lower(Recommendation.author) == author.lower(),
+            Recommendation.author_lc == author.lower(),
             Recommendation.format == format_type
         ).first()
         
@@ -515,7 +515,7 @@ def api_flag_already_read(format_type):
                         # Re-query and update
                         rec = session.query(Recommendation).filter(
                             func.lower(Recommendation.title) == title.lower(),
-                            func.lower(Recommendation.author) == author.lower(),
+                            Recommendation.author_lc == author.lower(),
                             Recommendation.format == format_type
                         ).first()
                         if not rec:
@@ -580,7 +580,7 @@ def api_flag_duplicate(format_type):
         # Find or create recommendation (use case-insensitive matching)
         rec = session.query(Recommendation).filter(
             func.lower(Recommendation.title) == title.lower(),
-            func.lower(Recommendation.author) == author.lower(),
+            Recommendation.author_lc == author.lower(),
             Recommendation.format == format_type
         ).first()
         
@@ -613,7 +613,7 @@ def api_flag_duplicate(format_type):
                         # Re-query and update
                         rec = session.query(Recommendation).filter(
                             func.lower(Recommendation.title) == title.lower(),
-                            func.lower(Recommendation.author) == author.lower(),
+                            Recommendation.author_lc == author.lower(),
                             Recommendation.format == format_type
                         ).first()
                         if not rec: